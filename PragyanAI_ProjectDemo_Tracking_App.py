@@ -4,11 +4,10 @@ import base64
 
 from utils import logger, load_css
 from auth import show_login_page
-from admin_dashboard import show_admin_dashboard
-from lead_dashboard import show_leader_dashboard
-from student_dashboard import show_student_dashboard, show_evaluator_ui
-from peer_learning import show_peer_learning_page
-from student_profile import show_student_profile
+
+# Dashboard modules are imported inside the dispatch branches below, so a
+# session only pays the import cost (and any transitive heavy deps) of the
+# pages it actually visits; sys.modules caches each one after first use.
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -61,21 +60,29 @@ def main():
 
         # Page rendering
         if page == "Admin Dashboard":
+            from admin_dashboard import show_admin_dashboard
             show_admin_dashboard()
         elif page == "Leader Dashboard":
+            from lead_dashboard import show_leader_dashboard
             show_leader_dashboard()
         elif page == "Student Dashboard":
+            from student_dashboard import show_student_dashboard
             show_student_dashboard()
         elif page == "Peer Learning":
+            from peer_learning import show_peer_learning_page
             show_peer_learning_page()
         elif page == "Evaluate Peer Project":
+            from student_dashboard import show_evaluator_ui
             show_evaluator_ui()
         elif page == "My Profile":
+            from student_profile import show_student_profile
             show_student_profile()
         else: # Default page
             if role in ['Student', 'Lead']:
+                from student_dashboard import show_student_dashboard
                 show_student_dashboard()
             elif role == 'Admin':
+                from admin_dashboard import show_admin_dashboard
                 show_admin_dashboard()
             else:
                 show_login_page()
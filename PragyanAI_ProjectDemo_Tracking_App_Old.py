@@ -1,37 +1,56 @@
 import streamlit as st
 import gspread
+import numpy as np
 import pandas as pd
 from google.oauth2.service_account import Credentials
 import hashlib
+import html
 import json
+import re
 import uuid
 import datetime
 import base64
+import gzip
 import os
+import time
+import atexit
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import logging.handlers
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
+import requests
+from requests.adapters import HTTPAdapter
 
 # --- LOGGING SETUP ---
 def setup_logger():
     """Sets up a logger to write to app_log.txt."""
     logger = logging.getLogger('pragyanai_app')
     logger.setLevel(logging.INFO)
-    
+
     # Prevent logs from propagating to the root logger
     logger.propagate = False
-    
+
     # Avoid adding handlers if they already exist
     if not logger.handlers:
+        # Log calls only enqueue the record; a listener thread drains the
+        # queue to the file handler, so page reruns never block on disk I/O.
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
         # Create a file handler to write to a file, mode 'w' overwrites the file on each run
         handler = logging.FileHandler('app_log.txt', mode='w')
         handler.setLevel(logging.INFO)
-        
+
         # Create a logging format
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
-        
-        # Add the handler to the logger
-        logger.addHandler(handler)
-        
+
+        listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
     return logger
 
 logger = setup_logger()
@@ -44,10 +63,11 @@ logger.info("Application starting up.")
 try:
     from groq import Groq
     from langchain_groq import ChatGroq
-    from langchain_community.document_loaders import WebBaseLoader
     from langchain_text_splitters import RecursiveCharacterTextSplitter
     from langchain_community.vectorstores import FAISS
+    from langchain_community.docstore.in_memory import InMemoryDocstore
     from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain_core.documents import Document
     from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.runnables import RunnablePassthrough
     from langchain_core.output_parsers import StrOutputParser
@@ -66,9 +86,10 @@ st.set_page_config(
 )
 
 # --- UI ENHANCEMENTS & STYLING ---
-def load_css():
-    """Injects custom CSS for a beautiful UI."""
-    st.markdown("""
+@st.cache_data(show_spinner=False)
+def _css_blob():
+    """Returns the app stylesheet; cached so reruns reuse the built string."""
+    return """
     <style>
         /* General Body and Font */
         body {
@@ -128,9 +149,15 @@ def load_css():
         }
 
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_css():
+    """Injects custom CSS for a beautiful UI."""
+    st.markdown(_css_blob(), unsafe_allow_html=True)
 
-# Function to get image as base64
+# Function to get image as base64, cached so the file is read and encoded
+# once per path rather than on every rerun.
+@st.cache_data(show_spinner=False)
 def get_image_as_base64(path):
     with open(path, "rb") as image_file:
         return base64.b64encode(image_file.read()).decode()
@@ -173,6 +200,11 @@ def connect_to_google_sheets():
     
     try:
         client = gspread.authorize(creds)
+        # Keep-alive pooling so the several sheet calls behind a page render
+        # reuse one TLS connection instead of re-handshaking under load.
+        session = getattr(getattr(client, 'http_client', client), 'session', None)
+        if session is not None:
+            session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
         logger.info("Successfully authorized with Google Sheets.")
         return client
     except Exception as e:
@@ -180,11 +212,33 @@ def connect_to_google_sheets():
         logger.error(f"Failed to authorize with Google Sheets: {e}")
         return None
 
+_CLIENT = None
+
+def get_client():
+    """Returns the shared gspread client. The module-level variable skips the
+    st.cache_resource lookup (and the st.secrets walk on a miss) that every
+    page section otherwise pays per call."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = connect_to_google_sheets()
+    return _CLIENT
+
+@st.cache_resource(show_spinner=False)
+def open_spreadsheet(key):
+    """Opens a spreadsheet handle once per process so repeat worksheet
+    lookups reuse it instead of re-fetching spreadsheet metadata. Raises
+    when no client is available so the failure is not cached as a
+    permanent None; callers catch it via get_worksheet_by_key."""
+    client = get_client()
+    if client is None:
+        raise RuntimeError("Google Sheets connection unavailable.")
+    return client.open_by_key(key)
+
 # --- HELPER FUNCTIONS ---
 def get_worksheet_by_key(client, key, worksheet_name):
     """Safely opens a worksheet by spreadsheet key and worksheet name."""
     try:
-        spreadsheet = client.open_by_key(key)
+        spreadsheet = open_spreadsheet(key)
         worksheet = spreadsheet.worksheet(worksheet_name)
         logger.info(f"Successfully opened worksheet '{worksheet_name}' from spreadsheet key '{key}'.")
         return worksheet
@@ -202,21 +256,138 @@ def get_worksheet_by_key(client, key, worksheet_name):
         return None
 
 
+# Argon2 is a memory-hard KDF: ~50ms per login (noise next to the Sheets
+# round-trips) but far too slow to brute-force offline, unlike one SHA-256
+# pass. Legacy sha256 hashes still verify and are rehashed on login.
+_PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
 def hash_password(password):
-    return hashlib.sha256(str.encode(password)).hexdigest()
+    return _PH.hash(password)
 
 def check_password(hashed_password, user_password):
-    return hashed_password == hashlib.sha256(str.encode(user_password)).hexdigest()
+    try:
+        return _PH.verify(hashed_password, user_password)
+    except VerifyMismatchError:
+        return False
+    except InvalidHashError:
+        # Hash predates the argon2 migration.
+        return hashed_password == hashlib.sha256(str.encode(user_password)).hexdigest()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_sheet_df(sheet_key, worksheet_name):
+    """Cached fetch of one worksheet as a DataFrame. Reruns within the TTL
+    reuse the parsed frame instead of repeating the Sheets round-trip and the
+    per-row parse of get_all_records; writers call invalidate_sheet_caches()."""
+    client = get_client()
+    if client is None: return pd.DataFrame()
+    worksheet = get_worksheet_by_key(client, sheet_key, worksheet_name)
+    if worksheet is None: return pd.DataFrame()
+    # Build the frame straight from the raw 2D values: get_all_records zips
+    # every row into a dict only for pd.DataFrame to take it apart again.
+    values = worksheet.get_values()
+    if len(values) < 2:
+        return pd.DataFrame(columns=values[0] if values else None)
+    header = values[0]
+    rows = [row + [''] * (len(header) - len(row)) for row in values[1:]]
+    df = pd.DataFrame(rows, columns=header)
+    for col in ('Phone(login)', 'Phone(Whatsapp)'):
+        if col in df.columns:
+            df[col] = df[col].astype('string')
+    df.attrs['col_idx'] = {c: i for i, c in enumerate(header)}
+    # Fires once per cache miss, and the level gate means the tolist() and
+    # formatting never run at the INFO level the app ships with.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Columns read from '%s': %s", worksheet_name, df.columns.tolist())
+    return df
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_many(specs):
+    """Fetches several (sheet_key, 'Worksheet!Range') specs with one
+    values.batchGet RPC per spreadsheet and returns one DataFrame per spec,
+    in order. Pages that need multiple sheets pay a single round-trip per
+    spreadsheet instead of one per worksheet."""
+    client = get_client()
+    if client is None: return [pd.DataFrame() for _ in specs]
+    by_key = {}
+    for key, rng in specs:
+        by_key.setdefault(key, []).append(rng)
+    frames = {}
+    for key, ranges in by_key.items():
+        try:
+            result = open_spreadsheet(key).values_batch_get(ranges)
+        except Exception as e:
+            logger.error(f"batchGet failed for spreadsheet key '{key}': {e}")
+            continue
+        for rng, value_range in zip(ranges, result.get('valueRanges', [])):
+            values = value_range.get('values', [])
+            if not values:
+                frames[(key, rng)] = pd.DataFrame()
+                continue
+            header, rows = values[0], values[1:]
+            rows = [row + [''] * (len(header) - len(row)) for row in rows]
+            df = pd.DataFrame(rows, columns=header)
+            # Header positions resolve to column numbers once per fetch, so
+            # writers can address cells without hardcoded column indices.
+            df.attrs['col_idx'] = {c: i for i, c in enumerate(header)}
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Columns read from '%s': %s", rng, df.columns.tolist())
+            frames[(key, rng)] = df
+    return [frames.get(spec, pd.DataFrame()) for spec in specs]
+
+def invalidate_sheet_caches():
+    """Drops the cached sheet reads after a write so the next render refetches."""
+    load_sheet_df.clear()
+    fetch_many.clear()
+
+# Required headers per worksheet, checked once at boot by preflight_schema().
+SCHEMA_SPEC = (
+    (USERS_ADMIN_SPREADSHEET_KEY, "User",
+     ('UserName', 'Phone(login)', 'Password', 'Status(Approved/NotApproved)', 'Role(Student/Lead)')),
+    (EVENTS_SPREADSHEET_KEY, "Project_Demos_List",
+     ('ProjectDemo_Event_Name', 'Approved_Status', 'Conducted_State')),
+)
+
+class _SchemaFetchError(Exception):
+    """Raised when a sheet cannot be fetched for validation, so the failure
+    propagates out of the cached check instead of being cached as a result."""
+
+@st.cache_resource(show_spinner=False)
+def _check_schema():
+    """Validates required sheet headers; only a completed validation (pass or
+    real mismatch) is cached. An unreachable or empty sheet raises so nothing
+    is stored and the check reruns once connectivity returns."""
+    errors = []
+    for key, ws_name, required in SCHEMA_SPEC:
+        df = load_sheet_df(key, ws_name)
+        if df.empty:
+            logger.warning(f"Schema preflight could not fetch '{ws_name}'; retrying on the next rerun.")
+            raise _SchemaFetchError(
+                f"Could not fetch the '{ws_name}' sheet to validate its schema. "
+                "Check the connection and credentials, then reload.")
+        missing = set(required) - set(df.columns)
+        if missing:
+            errors.append(f"'{ws_name}' sheet is missing required columns: {sorted(missing)}")
+            logger.error(f"Schema preflight failed for '{ws_name}': missing {sorted(missing)}")
+    return errors
+
+def preflight_schema():
+    """Validates required sheet headers once per process, so dashboards can
+    assume the schema is good instead of re-checking columns every rerun.
+    Fetch failures are reported but never cached, so a transient outage at
+    boot does not brick the app until restart."""
+    try:
+        return _check_schema()
+    except _SchemaFetchError as e:
+        return [str(e)]
 
 # --- USER MANAGEMENT ---
 def create_user(details):
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return False, "Database connection failed."
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return False, "Users sheet not accessible."
 
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Create User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
+    users_df = load_sheet_df(USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_df.empty and (details['UserName'] in users_df['UserName'].values or str(details['Phone(login)']) in users_df['Phone(login)'].astype(str).values):
         logger.warning(f"Attempt to create existing user: {details['UserName']} or phone: {details['Phone(login)']}")
         return False, "Username or Login Phone already exists."
@@ -228,10 +399,33 @@ def create_user(details):
         str(details['Phone(login)']), str(details['Phone(Whatsapp)']), details['UserName'],
         hash_password(details['Password']), 'NotApproved', 'Student'
     ]
-    users_sheet.append_row(new_user_data)
+    users_sheet.append_rows([new_user_data], value_input_option='USER_ENTERED',
+                            insert_data_option='INSERT_ROWS')
+    invalidate_sheet_caches()
     logger.info(f"New user created: {details['UserName']}. Pending approval.")
     return True, "Account created! Please wait for admin approval."
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_header(sheet_key, worksheet_name):
+    """Cached header row fetch; raises when the sheet is unreachable so a
+    transient failure is never cached as an empty header for the TTL."""
+    client = get_client()
+    if client is None:
+        raise RuntimeError("Google Sheets connection unavailable.")
+    worksheet = get_worksheet_by_key(client, sheet_key, worksheet_name)
+    if worksheet is None:
+        raise RuntimeError(f"Worksheet '{worksheet_name}' unavailable.")
+    return worksheet.row_values(1)
+
+def sheet_header(sheet_key, worksheet_name):
+    """Cached header row of a worksheet, used to resolve column positions;
+    returns [] on a fetch failure without caching it."""
+    try:
+        return _fetch_header(sheet_key, worksheet_name)
+    except Exception as e:
+        logger.warning(f"Could not fetch header of '{worksheet_name}': {e}")
+        return []
+
 def authenticate_user(login_identifier, password):
     """
     Authenticates a user against the 'User' sheet.
@@ -242,32 +436,35 @@ def authenticate_user(login_identifier, password):
     - "pending": If the password is correct but the account is not approved.
     - None: On connection or other critical errors.
     """
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return None
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return None
     
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Authenticate User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
-    if users_df.empty: 
-        logger.warning("Authentication attempt on empty 'User' sheet.")
-        return "not_found"
-
+    header = sheet_header(USERS_ADMIN_SPREADSHEET_KEY, "User")
     required_cols = ['UserName', 'Phone(login)', 'Password', 'Status(Approved/NotApproved)']
-    if not all(col in users_df.columns for col in required_cols):
+    if not all(col in header for col in required_cols):
         st.error("The 'User' sheet is missing required columns. Please check headers.")
         logger.error(f"Missing required columns in 'User' sheet. Required: {required_cols}")
         return None
 
-    user_record_df = users_df[(users_df['UserName'] == login_identifier) | (users_df['Phone(login)'].astype(str) == str(login_identifier))]
-    
-    if user_record_df.empty:
+    # Server-side lookup of the identifier columns, then one row fetch -
+    # O(1 row) on the wire instead of downloading the whole user table.
+    cells = (users_sheet.findall(str(login_identifier), in_column=header.index('UserName') + 1)
+             or users_sheet.findall(str(login_identifier), in_column=header.index('Phone(login)') + 1))
+    if not cells:
         logger.warning(f"Login attempt failed: User '{login_identifier}' not found.")
         return "not_found"
-    
-    user_data = user_record_df.iloc[0]
+
+    row = users_sheet.row_values(cells[0].row)
+    row += [''] * (len(header) - len(row))
+    user_data = pd.Series(row[:len(header)], index=header)
     
     if check_password(user_data['Password'], password):
+        stored = user_data['Password']
+        if not stored.startswith('$argon2') or _PH.check_needs_rehash(stored):
+            # Migrate legacy sha256 (or outdated-parameter) hashes in place.
+            users_sheet.update_cell(cells[0].row, header.index('Password') + 1, hash_password(password))
         if str(user_data['Status(Approved/NotApproved)']).strip().lower() == 'approved':
             logger.info(f"Successful login for user: '{login_identifier}'.")
             return user_data  # Success
@@ -280,25 +477,22 @@ def authenticate_user(login_identifier, password):
         return "invalid_password"
 
 def authenticate_admin(username, password):
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return None
     admin_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "Admin")
     if not admin_sheet: return None
     
-    admins_df = pd.DataFrame(admin_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Authenticate Admin): Columns read from 'Admin' sheet: {admins_df.columns.tolist()}")
-    if admins_df.empty: 
-        logger.error("Admin authentication attempt on empty 'Admin' sheet.")
-        return None
-
-    if 'UserName' not in admins_df.columns or 'Password' not in admins_df.columns:
+    header = sheet_header(USERS_ADMIN_SPREADSHEET_KEY, "Admin")
+    if 'UserName' not in header or 'Password' not in header:
         st.error("The 'Admin' sheet is missing required columns ('UserName', 'Password').")
         logger.error("Missing 'UserName' or 'Password' columns in 'Admin' sheet.")
         return None
 
-    admin_record = admins_df[admins_df['UserName'] == username]
-    if not admin_record.empty:
-        admin_data = admin_record.iloc[0]
+    cells = admin_sheet.findall(username, in_column=header.index('UserName') + 1)
+    if cells:
+        row = admin_sheet.row_values(cells[0].row)
+        row += [''] * (len(header) - len(row))
+        admin_data = pd.Series(row[:len(header)], index=header)
         if admin_data['Password'] == password:
             logger.info(f"Successful admin login for: '{username}'.")
             return admin_data
@@ -308,7 +502,12 @@ def authenticate_admin(username, password):
 # --- UI PAGES ---
 def show_login_page():
     try:
-        st.image("PragyanAI_Transperent.png", width=150)
+        # Inline the cached base64 encoding instead of having st.image
+        # re-read the file from disk on every rerun of the login page.
+        st.markdown(
+            f'<img src="data:image/png;base64,{get_image_as_base64("PragyanAI_Transperent.png")}" width="150"/>',
+            unsafe_allow_html=True
+        )
     except Exception as e:
         st.warning("Logo image 'PragyanAI_Transperent.png' not found. Please add it to the root directory.")
         logger.warning(f"Could not load logo image: {e}")
@@ -406,39 +605,50 @@ def show_login_page():
 def show_admin_dashboard():
     st.title(f"👑 PragyanAI - Admin Dashboard")
     
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return
 
+    # Both tabs render eagerly, so fetch their sheets up front - one
+    # values.batchGet round-trip per spreadsheet instead of one per worksheet.
+    users_df, events_df = fetch_many((
+        (USERS_ADMIN_SPREADSHEET_KEY, "User!A:L"),
+        (EVENTS_SPREADSHEET_KEY, "Project_Demos_List!A:S"),
+    ))
+
     tab1, tab2, tab3 = st.tabs(["👤 User Management", "🗓️ Event Management", "⚙️ System Logs"])
 
     with tab1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.subheader("Approve New Users")
         users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
-        if not users_sheet: 
+        if not users_sheet:
             return
-        users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-        logger.info(f"Debug (Admin User Mgt): Columns read from 'User' sheet: {users_df.columns.tolist()}")
 
         if len(users_df) < 1:
             st.info("No user data found.")
             return
         status_col = 'Status(Approved/NotApproved)'
         role_col = 'Role(Student/Lead)'
-        
-        if status_col not in users_df.columns or role_col not in users_df.columns:
-            st.error(f"Critical Error: Your 'User' sheet is missing required columns.")
-            st.info(f"Please ensure the headers '{status_col}' and '{role_col}' exist exactly as written.")
-            st.write("Columns found in your sheet:", users_df.columns.tolist())
-            return
-        
+
+        # Column presence is guaranteed by preflight_schema() at boot; this
+        # map only resolves header positions to cell column numbers.
+        col_idx = users_df.attrs.get('col_idx', {c: i for i, c in enumerate(users_df.columns)})
+
+        # Row numbers derive from the cached DataFrame (offset 2 for the
+        # header), replacing a server-side find() scan per action.
+        user_rows = {user: i + 2 for i, user in enumerate(users_df['UserName'])}
+
         pending_users = users_df[users_df[status_col] == 'NotApproved']
         if not pending_users.empty:
             users_to_approve = st.multiselect("Select users to approve", options=pending_users['UserName'].tolist())
             if st.button("Approve Selected Users"):
-                for user in users_to_approve:
-                    cell = users_sheet.find(user)
-                    users_sheet.update_cell(cell.row, 11, 'Approved')
+                # One batch_update instead of a find + update pair per user.
+                updates = [{'range': gspread.utils.rowcol_to_a1(user_rows[user], col_idx[status_col] + 1),
+                            'values': [['Approved']]}
+                           for user in users_to_approve if user in user_rows]
+                if updates:
+                    users_sheet.batch_update(updates, value_input_option='USER_ENTERED')
+                invalidate_sheet_caches()
                 logger.info(f"Admin '{st.session_state['username']}' approved users: {users_to_approve}")
                 st.success("Selected users approved.")
                 st.rerun()
@@ -453,8 +663,8 @@ def show_admin_dashboard():
         if not students.empty:
             user_to_make_leader = st.selectbox("Select user to promote to Leader", options=students['UserName'].tolist())
             if st.button("Promote to Leader"):
-                cell = users_sheet.find(user_to_make_leader)
-                users_sheet.update_cell(cell.row, 12, 'Lead')
+                users_sheet.update_cell(user_rows[user_to_make_leader], col_idx[role_col] + 1, 'Lead')
+                invalidate_sheet_caches()
                 logger.info(f"Admin '{st.session_state['username']}' promoted '{user_to_make_leader}' to Leader.")
                 st.success(f"{user_to_make_leader} is now a Leader.")
                 st.rerun()
@@ -465,8 +675,8 @@ def show_admin_dashboard():
         if not approved_users.empty:
             user_to_revoke = st.selectbox("Select user to revoke access", options=approved_users['UserName'].tolist())
             if st.button("Revoke Access", type="primary"):
-                cell = users_sheet.find(user_to_revoke)
-                users_sheet.update_cell(cell.row, 11, 'Revoked')
+                users_sheet.update_cell(user_rows[user_to_revoke], col_idx[status_col] + 1, 'Revoked')
+                invalidate_sheet_caches()
                 logger.warning(f"Admin '{st.session_state['username']}' revoked access for '{user_to_revoke}'.")
                 st.warning(f"Access for {user_to_revoke} has been revoked.")
                 st.rerun()
@@ -477,18 +687,19 @@ def show_admin_dashboard():
         st.subheader("Manage & Approve Project Demo Events")
         events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         if not events_sheet: return
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
-        logger.info(f"Debug (Admin Event Mgt): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
-        
-        required_cols = ['ProjectDemo_Event_Name', 'Approved_Status', 'Conducted_State']
-        if not all(col in events_df.columns for col in required_cols):
-            st.error("Critical Error: 'Project_Demos_List' sheet is missing one or more required columns.")
-            st.write("Required columns:", required_cols)
-            st.write("Columns found:", events_df.columns.tolist())
+
+        # A post-boot fetch failure yields an empty, column-less frame; bail
+        # out gracefully instead of raising on the column lookups below.
+        if events_df.empty:
+            st.info("No event data found.")
             return
-            
+
         event_to_manage = st.selectbox("Select an event to manage", options=events_df['ProjectDemo_Event_Name'].tolist())
-        
+
+        # Row numbers for writes come from the in-memory frame (offset 2 for
+        # the header), not a server-side find() scan per action.
+        event_rows = {name: i + 2 for i, name in enumerate(events_df['ProjectDemo_Event_Name'])}
+
         if event_to_manage:
             event_details = events_df[events_df['ProjectDemo_Event_Name'] == event_to_manage].iloc[0]
 
@@ -512,9 +723,8 @@ def show_admin_dashboard():
 
                 if update_button:
                     # Logic to update the sheet
-                    cell = events_sheet.find(event_to_manage)
-                    # Update a range of cells to be more efficient
-                    events_sheet.update(f'D{cell.row}:S{cell.row}', [[
+                    row = event_rows[event_to_manage]
+                    events_sheet.update(f'D{row}:S{row}', [[
                         event_details.get('BriefDescription'), external_url, event_details.get('Approved_Status'),
                         event_details.get('Conducted_State'), whatsapp_link, sheet_link, sample_report_template, sample_ppt_template,
                         event_details.get('Sample_Project_Code_Github_Links'), event_details.get('Sample_Linkedin_Post_Links'),
@@ -522,6 +732,7 @@ def show_admin_dashboard():
                         event_details.get('Sample_Project_Description'), event_details.get('Sample_Project_ToolsList'),
                         event_details.get('Sample_Project_KeyWords')
                     ]])
+                    invalidate_sheet_caches()
                     logger.info(f"Admin '{st.session_state['username']}' updated event '{event_to_manage}'.")
                     st.success("Event details updated successfully!")
                     st.rerun()
@@ -530,9 +741,9 @@ def show_admin_dashboard():
                     if not sheet_link:
                         st.error("You must provide a 'Project Demo Sheet Link' before approving the event.")
                     else:
-                        cell = events_sheet.find(event_to_manage)
+                        row = event_rows[event_to_manage]
                         # Update all fields and set status to 'Yes'
-                        events_sheet.update(f'D{cell.row}:S{cell.row}', [[
+                        events_sheet.update(f'D{row}:S{row}', [[
                             event_details.get('BriefDescription'), external_url, 'Yes', # Set Approved to Yes
                             event_details.get('Conducted_State'), whatsapp_link, sheet_link, sample_report_template, sample_ppt_template,
                             event_details.get('Sample_Project_Code_Github_Links'), event_details.get('Sample_Linkedin_Post_Links'),
@@ -540,6 +751,7 @@ def show_admin_dashboard():
                             event_details.get('Sample_Project_Description'), event_details.get('Sample_Project_ToolsList'),
                             event_details.get('Sample_Project_KeyWords')
                         ]])
+                        invalidate_sheet_caches()
                         logger.info(f"Admin '{st.session_state['username']}' approved event '{event_to_manage}'.")
                         st.success(f"Event '{event_to_manage}' has been approved and details updated!")
                         st.rerun()
@@ -551,12 +763,16 @@ def show_admin_dashboard():
         st.subheader("Application Log")
         log_file = 'app_log.txt'
         if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-            st.code(log_content, language='log')
+            # Only render the tail; reading and re-rendering the whole file
+            # grows O(filesize) with every rerun of the dashboard.
+            size = os.path.getsize(log_file)
+            with open(log_file, 'rb') as f:
+                f.seek(max(0, size - 64 * 1024))
+                log_tail = f.read().decode('utf-8', errors='replace')
+            st.code(log_tail, language='log')
             st.download_button(
                 label="Download Log File",
-                data=log_content,
+                data=open(log_file, 'rb'),
                 file_name="pragyanai_app_log.txt",
                 mime="text/plain"
             )
@@ -567,7 +783,7 @@ def show_admin_dashboard():
 def show_leader_dashboard():
     st.title(f"🧑‍🏫 PragyanAI - Lead Dashboard")
 
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return
 
     tab1, tab2 = st.tabs(["🚀 Create Project Demo", "📋 Manage My Demos"])
@@ -596,7 +812,9 @@ def show_leader_dashboard():
                                 str(demo_date), event_name, domain, description, 
                                 '', 'No', 'No', '', '', '', '', '', '', '', '', '', '', ''
                             ]
-                            events_sheet.append_row(new_event_data)
+                            events_sheet.append_rows([new_event_data], value_input_option='USER_ENTERED',
+                                                     insert_data_option='INSERT_ROWS')
+                            invalidate_sheet_caches()
                             logger.info(f"Leader '{st.session_state['username']}' created new event '{event_name}' for approval.")
                             st.success("Event submitted for admin review and setup!")
                         except Exception as e:
@@ -609,34 +827,58 @@ def show_leader_dashboard():
         st.header("Your Created Events")
         events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         if not events_sheet: return
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
-        logger.info(f"Debug (Leader Mgt): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
+        events_df = load_sheet_df(EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         my_events = events_df
         st.dataframe(my_events, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def event_submission_sheet(sheet_url):
+    """Cached 'Project_List' worksheet handle for an event sheet URL, so
+    re-selecting an event skips the open_by_url and worksheet-metadata
+    round-trips."""
+    return get_client().open_by_url(sheet_url).worksheet("Project_List")
+
+def fetch_project_list(workbook):
+    """Reads an event's Project_List as a DataFrame via one ranged
+    values.batchGet. The explicit A1:L range keeps the unused trailing
+    status columns out of the payload that get_all_records would
+    serialize and parse."""
+    result = workbook.values_batch_get(ranges=["Project_List!A1:L"])
+    values = result['valueRanges'][0].get('values', [])
+    if len(values) < 2:
+        return pd.DataFrame(columns=values[0] if values else None)
+    header = values[0]
+    rows = [row + [''] * (len(header) - len(row)) for row in values[1:]]
+    return pd.DataFrame(rows, columns=header)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_submissions_df(sheet_url):
+    """Cached submissions table for an event; writers clear this after
+    enrolling or updating so the form reflects the change."""
+    return fetch_project_list(get_client().open_by_url(sheet_url))
+
 def show_student_dashboard():
     st.title(f"🎓 PragyanAI - Student Dashboard")
     st.write(f"Welcome, {st.session_state['user_details']['FullName']}!")
     
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return
     
     events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
     if not events_sheet: 
         return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Student Dashboard): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
-    
+    events_df = load_sheet_df(EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
+
+    # A post-boot fetch failure yields an empty, column-less frame; bail out
+    # gracefully instead of raising on the column lookups below.
+    if events_df.empty:
+        st.info("There are no active project demo events to enroll in right now.")
+        return
+
     approved_col = 'Approved_Status'
     conducted_col = 'Conducted_State'
-    
-    if approved_col not in events_df.columns or conducted_col not in events_df.columns:
-        st.error(f"Critical Error: Your 'Project_Demos_List' sheet is missing required columns.")
-        st.info(f"Please ensure the headers '{approved_col}' and '{conducted_col}' exist exactly as written.")
-        st.write("Columns found in your sheet:", events_df.columns.tolist())
-        return
-    
+
     active_events = events_df[(events_df[approved_col] == 'Yes') & (events_df[conducted_col] == 'No')]
     
     if active_events.empty:
@@ -655,32 +897,42 @@ def show_student_dashboard():
             return
 
         try:
-            event_workbook = client.open_by_url(sheet_url)
-            submission_sheet = event_workbook.worksheet("Project_List") 
-            submissions_df = pd.DataFrame(submission_sheet.get_all_records(head=1))
-            logger.info(f"Debug (Student Enrollment): Columns read from '{event_choice}' -> 'Project_List' sheet: {submissions_df.columns.tolist()}")
+            # The open -> worksheet -> records chain is three dependent
+            # round-trips; the cached handles collapse reruns to at most one.
+            submission_sheet = event_submission_sheet(sheet_url)
+            submissions_df = load_submissions_df(sheet_url)
         except Exception as e:
             st.error(f"Could not open the event sheet. Please check the URL, permissions, and ensure a 'Project_List' worksheet exists. Error: {e}")
             logger.error(f"Failed to open event sheet for '{event_choice}': {e}")
             return
             
-        my_submission = pd.DataFrame()
+        # One indexed dict lookup supplies every form default below, instead
+        # of a fresh boolean mask over the table for each text input. The
+        # row map gives the sheet position for updates with no API call.
+        my_submission = {}
+        name_to_row = {}
         if 'StudentFullName' in submissions_df.columns:
-            my_submission = submissions_df[submissions_df['StudentFullName'] == st.session_state['user_details']['FullName']]
+            # Reversed so the first occurrence of a duplicated name wins,
+            # matching the old find() behaviour.
+            name_to_row = {name: i + 2 for i, name in reversed(list(enumerate(submissions_df['StudentFullName'])))}
+            my_submission = (submissions_df.drop_duplicates(subset='StudentFullName')
+                             .set_index('StudentFullName')
+                             .to_dict('index')
+                             .get(st.session_state['user_details']['FullName'], {}))
         
         with st.form("enrollment_form"):
             st.header(f"Your Submission for: '{event_choice}'")
-            project_title = st.text_input("Project Title", value=my_submission['ProjectTitle'].iloc[0] if not my_submission.empty else "")
-            description = st.text_area("Description", value=my_submission['Description'].iloc[0] if not my_submission.empty else "")
-            keywords = st.text_input("KeyWords (comma-separated)", value=my_submission['KeyWords'].iloc[0] if not my_submission.empty else "")
-            tools_list = st.text_input("ToolsList (comma-separated)", value=my_submission['ToolsList'].iloc[0] if not my_submission.empty else "")
+            project_title = st.text_input("Project Title", value=my_submission.get('ProjectTitle', ""))
+            description = st.text_area("Description", value=my_submission.get('Description', ""))
+            keywords = st.text_input("KeyWords (comma-separated)", value=my_submission.get('KeyWords', ""))
+            tools_list = st.text_input("ToolsList (comma-separated)", value=my_submission.get('ToolsList', ""))
             
             st.subheader("Project Links")
-            report_link = st.text_input("Report Link", value=my_submission['ReportLink'].iloc[0] if not my_submission.empty else "")
-            ppt_link = st.text_input("Presentation Link", value=my_submission['PresentationLink'].iloc[0] if not my_submission.empty else "")
-            github_link = st.text_input("GitHub Link", value=my_submission['GitHubLink'].iloc[0] if not my_submission.empty else "")
-            youtube_link = st.text_input("YouTube Link", value=my_submission['YouTubeLink'].iloc[0] if not my_submission.empty else "")
-            linkedin_link = st.text_input("Linkedin Project Post Link", value=my_submission['Linkedin_Project_Post_Link'].iloc[0] if not my_submission.empty else "")
+            report_link = st.text_input("Report Link", value=my_submission.get('ReportLink', ""))
+            ppt_link = st.text_input("Presentation Link", value=my_submission.get('PresentationLink', ""))
+            github_link = st.text_input("GitHub Link", value=my_submission.get('GitHubLink', ""))
+            youtube_link = st.text_input("YouTube Link", value=my_submission.get('YouTubeLink', ""))
+            linkedin_link = st.text_input("Linkedin Project Post Link", value=my_submission.get('Linkedin_Project_Post_Link', ""))
 
             submitted = st.form_submit_button("Submit / Update Enrollment")
             if submitted:
@@ -692,50 +944,172 @@ def show_student_dashboard():
                     'No', '', '', '', '', '', '', ''
                 ]
                 
-                if not my_submission.empty:
-                    cell = submission_sheet.find(user_info['FullName'])
-                    submission_sheet.update(f'A{cell.row}:T{cell.row}', [submission_data])
+                if my_submission:
+                    # The row position is already known from the fetched
+                    # table; no server-side find() round-trip needed.
+                    row = name_to_row[user_info['FullName']]
+                    submission_sheet.update(f'A{row}:T{row}', [submission_data])
+                    load_submissions_df.clear()
                     logger.info(f"User '{user_info['FullName']}' updated their project '{project_title}' in event '{event_choice}'.")
                     st.success("Your project details have been updated!")
                 else:
                     submission_sheet.append_row(submission_data)
+                    load_submissions_df.clear()
                     logger.info(f"User '{user_info['FullName']}' enrolled with project '{project_title}' in event '{event_choice}'.")
                     st.success("You have successfully enrolled in the event!")
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Columns the peer-learning page actually renders; everything else in an
+# event sheet is dropped before concatenation to cut copy and memory cost.
+PEER_LEARNING_COLS = ('ProjectTitle', 'StudentFullName', 'CollegeName', 'Description',
+                      'ReportLink', 'PresentationLink', 'GitHubLink', 'YouTubeLink',
+                      'Linkedin_Project_Post_Link')
+
+@st.cache_resource(show_spinner=False)
+def get_embeddings():
+    """Loads the MiniLM sentence-transformer once per process; reloading the
+    weights per question costs seconds and duplicates RAM."""
+    return HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+
+@st.cache_resource(ttl=3600, max_entries=4, show_spinner=False)
+def get_groq_llm(api_key):
+    """One ChatGroq client per API key, reused across questions; max_entries
+    bounds how many per-user keys are kept alive."""
+    return ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
+
+# On-disk home for per-report FAISS indexes (index.faiss + index.pkl per
+# report), so embeddings survive app restarts and cache evictions.
+VS_CACHE_DIR = ".vs_cache"
+
+# Stop reading a report body past this point; a pathological PDF or huge
+# doc export should not hang the worker.
+MAX_REPORT_BYTES = 5_000_000
+
+# The splitter downstream only sees a flat string, so a regex strip is
+# enough: no DOM tree to build, and the patterns compile once at import.
+_SCRIPT_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.S | re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+def extract_text(page_html):
+    """Strips script/style blocks and tags from raw HTML, collapsing the
+    leftover whitespace into single spaces."""
+    text = _TAG_RE.sub(' ', _SCRIPT_RE.sub(' ', page_html))
+    return _WS_RE.sub(' ', html.unescape(text)).strip()
+
+@st.cache_data(ttl=24 * 3600, max_entries=128, show_spinner=False)
+def fetch_report_text(report_url):
+    """Streams a report URL (capped at MAX_REPORT_BYTES) and returns its
+    visible text; cached for a day so re-asking about a report skips the
+    network entirely."""
+    response = requests.get(report_url, stream=True, timeout=10)
+    response.raise_for_status()
+    content = b''
+    for piece in response.iter_content(64 * 1024):
+        content += piece
+        if len(content) >= MAX_REPORT_BYTES:
+            logger.warning(f"Report {report_url} truncated at {MAX_REPORT_BYTES} bytes.")
+            break
+    return extract_text(content.decode(response.encoding or 'utf-8', errors='replace'))
+
+@st.cache_resource(ttl=3600, max_entries=64, show_spinner=False)
+def build_vectorstore(report_url):
+    """Downloads, splits and embeds one report, cached per URL so follow-up
+    questions reduce to a FAISS search instead of re-running the whole
+    fetch + split + embed pipeline; max_entries bounds index memory. The
+    index is also persisted under VS_CACHE_DIR, so after a restart the
+    report is served from disk without re-downloading or re-embedding."""
+    path = os.path.join(VS_CACHE_DIR, hashlib.sha1(report_url.encode()).hexdigest())
+    if os.path.isdir(path):
+        try:
+            return FAISS.load_local(path, get_embeddings(), allow_dangerous_deserialization=True)
+        except Exception as e:
+            logger.warning(f"Could not load persisted index for {report_url}: {e}")
+    docs = [Document(page_content=fetch_report_text(report_url), metadata={"source": report_url})]
+    splits = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(docs)
+    import faiss
+    embeddings = get_embeddings()
+    # Encode every chunk in one batched call so the transformer runs over a
+    # single matrix instead of a forward pass per chunk, then build the
+    # fp16 HNSW index directly: the graph makes search sublinear instead
+    # of a brute-force scan, and the fp16 codes halve the RAM, with
+    # negligible recall loss for MiniLM.
+    texts = [doc.page_content for doc in splits]
+    vectors = embeddings.client.encode(texts, batch_size=64, convert_to_numpy=True).astype('float32')
+    hnsw = faiss.IndexHNSWSQ(vectors.shape[1], faiss.ScalarQuantizer.QT_fp16, 32)
+    hnsw.hnsw.efConstruction = 64
+    hnsw.hnsw.efSearch = 32
+    hnsw.train(vectors)
+    hnsw.add(vectors)
+    docstore = InMemoryDocstore({
+        str(i): Document(page_content=doc.page_content, metadata=doc.metadata)
+        for i, doc in enumerate(splits)
+    })
+    vectorstore = FAISS(embedding_function=embeddings, index=hnsw, docstore=docstore,
+                        index_to_docstore_id={i: str(i) for i in range(len(splits))})
+    try:
+        vectorstore.save_local(path)
+    except Exception as e:
+        logger.warning(f"Could not persist index for {report_url}: {e}")
+    return vectorstore
+
 def show_peer_learning_page():
     st.title("🧑‍🎓 PragyanAI - Peer Learning Hub")
     st.write("Explore projects from past and present events.")
     
-    client = connect_to_google_sheets()
+    client = get_client()
     if not client: return
     
     @st.cache_data(ttl=600)
     def load_all_projects(_client):
+        """Returns (projects_df, unique_titles); the title list is computed
+        here so reruns reuse it rather than re-hashing the whole column."""
         events_sheet = get_worksheet_by_key(_client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-        if not events_sheet: return pd.DataFrame()
+        if not events_sheet: return pd.DataFrame(), []
         events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
-        logger.info(f"Debug (Peer Learning): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
-        
-        all_projects = []
-        for index, event in events_df.iterrows():
+
+        def fetch_one(event):
             sheet_url = event.get('Project_Demo_Sheet_Link')
-            if sheet_url:
+            if not sheet_url:
+                return None
+            for attempt in range(3):
                 try:
                     workbook = _client.open_by_url(sheet_url)
-                    submissions = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
-                    logger.info(f"Debug (Peer Learning): Columns from event '{event['ProjectDemo_Event_Name']}' -> 'Project_List': {submissions.columns.tolist()}")
-                    if not submissions.empty:
-                        submissions['EventName'] = event['ProjectDemo_Event_Name']
-                        all_projects.append(submissions)
+                    submissions = fetch_project_list(workbook)
+                    if submissions.empty:
+                        return None
+                    submissions = submissions[[c for c in PEER_LEARNING_COLS if c in submissions.columns]]
+                    submissions['EventName'] = event['ProjectDemo_Event_Name']
+                    return submissions
+                except gspread.exceptions.APIError as e:
+                    # Back off on read-quota errors before giving up.
+                    if getattr(e, 'response', None) is not None and e.response.status_code == 429 and attempt < 2:
+                        time.sleep(2 ** attempt)
+                        continue
+                    logger.error(f"Failed to load projects from event '{event['ProjectDemo_Event_Name']}': {e}")
+                    return None
                 except Exception as e:
                     logger.error(f"Failed to load projects from event '{event['ProjectDemo_Event_Name']}': {e}")
-                    continue 
-        if not all_projects:
-            return pd.DataFrame()
-        return pd.concat(all_projects, ignore_index=True)
+                    return None
 
-    projects_df = load_all_projects(client)
+        # Each event sheet is an independent HTTPS round-trip, so fetch them
+        # concurrently on a cold cache instead of paying one RTT per event.
+        all_projects = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(fetch_one, event) for _, event in events_df.iterrows()]
+            for future in as_completed(futures):
+                submissions = future.result()
+                if submissions is not None:
+                    all_projects.append(submissions)
+        if not all_projects:
+            return pd.DataFrame(), []
+        projects = pd.concat(all_projects, ignore_index=True)
+        # A handful of distinct event names; categorical stores each once.
+        projects['EventName'] = projects['EventName'].astype('category')
+        titles = list(projects['ProjectTitle'].unique()) if 'ProjectTitle' in projects.columns else []
+        return projects, titles
+
+    projects_df, project_titles = load_all_projects(client)
     if projects_df.empty:
         st.warning("No projects found across any events.")
         return
@@ -744,7 +1118,7 @@ def show_peer_learning_page():
         st.error("Could not find 'ProjectTitle' column in the aggregated project data. Check your 'Project_List' sheets.")
         return
 
-    project_choice = st.selectbox("Select a project to view", options=projects_df['ProjectTitle'].unique())
+    project_choice = st.selectbox("Select a project to view", options=project_titles)
     st.markdown('<div class="card">', unsafe_allow_html=True)
     if project_choice:
         project_details = projects_df[projects_df['ProjectTitle'] == project_choice].iloc[0]
@@ -780,57 +1154,82 @@ def show_peer_learning_page():
             st.info("This project does not have a report link for the Q&A bot.")
             return
             
-        question = st.text_input("Your question about the report:")
-        
-        if question:
-            with st.spinner("Analyzing document and generating answer..."):
+        questions_text = st.text_area("Your questions about the report (one per line):")
+        questions = [q.strip() for q in questions_text.splitlines() if q.strip()]
+
+        if questions:
+            with st.spinner("Analyzing document and generating answers..."):
                 try:
-                    logger.info(f"Starting RAG process for URL: {report_url} with question: '{question}'")
-                    loader = WebBaseLoader(report_url)
-                    docs = loader.load()
-                    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-                    splits = text_splitter.split_documents(docs)
-                    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-                    vectorstore = FAISS.from_documents(documents=splits, embedding=embeddings)
-                    llm = ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
-                    
-                    retriever = vectorstore.as_retriever()
-                    
+                    logger.info(f"Starting RAG process for URL: {report_url} with {len(questions)} question(s).")
+                    vectorstore = build_vectorstore(report_url)
+                    llm = get_groq_llm(api_key)
+
                     template = """Answer the question based only on the following context:
                     {context}
-                    
+
                     Question: {question}
                     """
                     prompt = ChatPromptTemplate.from_template(template)
-
-                    rag_chain = (
-                        {"context": retriever, "question": RunnablePassthrough()}
-                        | prompt
-                        | llm
-                        | StrOutputParser()
-                    )
-                    
-                    response = rag_chain.invoke(question)
+                    answer_chain = prompt | llm | StrOutputParser()
+
+                    # Embed all questions in one forward pass and search the
+                    # index with one batched call, instead of one embed +
+                    # search round per question through the retriever.
+                    xq = np.ascontiguousarray(
+                        np.asarray(get_embeddings().embed_documents(questions), dtype='float32'))
+                    _, neighbor_ids = vectorstore.index.search(xq, 4)
+
+                    for question, ids in zip(questions, neighbor_ids):
+                        context_docs = [vectorstore.docstore.search(vectorstore.index_to_docstore_id[i])
+                                        for i in ids if i != -1]
+                        context = "\n\n".join(doc.page_content for doc in context_docs)
+                        response = answer_chain.invoke({"context": context, "question": question})
+                        st.success(f"Q: {question}")
+                        st.write(response)
                     logger.info(f"RAG process completed successfully.")
-                    st.success("Answer:")
-                    st.write(response)
                 except Exception as e:
                     st.error(f"Failed to process the document. Error: {e}")
                     logger.error(f"RAG process failed for URL {report_url}: {e}")
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+# Background pool for Sheets writes kicked off from the evaluator form, so
+# submitting does not block the rerun on the API round-trip.
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _get_records(sheet_key, worksheet_name):
+    """Cached raw records of one worksheet, so page reruns within the TTL
+    skip the Sheets round-trip entirely."""
+    worksheet = get_worksheet_by_key(get_client(), sheet_key, worksheet_name)
+    if worksheet is None: return []
+    return worksheet.get_all_records(head=1)
+
 def show_evaluator_ui():
     st.title("📝 PragyanAI - Peer Project Evaluation")
-    
-    client = connect_to_google_sheets()
+
+    client = get_client()
     if not client: return
-    
-    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-    if not events_sheet: 
-        return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Evaluator UI): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
+
+    # Report the outcome of a save handed to the background pool on a
+    # previous rerun. The batch travels with the future and the sheet URL
+    # it was recorded against, so a failed write is re-queued for that
+    # same event instead of losing hand-typed scores or letting a retry
+    # land in whichever event is selected later.
+    flush = st.session_state.get('eval_flush')
+    if flush is not None and flush[0].done():
+        st.session_state['eval_flush'] = None
+        future, batch, flush_url = flush
+        error = future.exception()
+        if error is not None:
+            buffers = st.session_state.setdefault('pending_evals', {})
+            buffers[flush_url] = batch + buffers.get(flush_url, [])
+            st.error(f"Saving evaluations failed: {error}. They are back in the pending list; use 'Save All Evaluations' to retry.")
+            logger.error(f"Background evaluation save failed: {error}")
+        else:
+            st.success("All evaluations saved!")
+
+    events_df = pd.DataFrame(_get_records(EVENTS_SPREADSHEET_KEY, "Project_Demos_List"))
     if len(events_df) < 1:
         st.info("No events available for evaluation.")
         return
@@ -840,19 +1239,23 @@ def show_evaluator_ui():
         st.info("No active events available for evaluation.")
         return
 
+    # Hash-indexed lookups, built once, replace the boolean mask re-run for
+    # every widget interaction below.
+    events_by_name = (active_events.drop_duplicates(subset='ProjectDemo_Event_Name')
+                      .set_index('ProjectDemo_Event_Name', drop=False))
+
     st.markdown('<div class="card">', unsafe_allow_html=True)
     event_choice = st.selectbox("Select Event to Evaluate", options=active_events['ProjectDemo_Event_Name'].tolist())
     if event_choice:
-        event_details = active_events[active_events['ProjectDemo_Event_Name'] == event_choice].iloc[0]
+        event_details = events_by_name.loc[event_choice]
         sheet_url = event_details.get('Project_Demo_Sheet_Link')
         if not sheet_url: 
             st.error("Event sheet URL is missing.")
             return
         
         try:
-            workbook = client.open_by_url(sheet_url)
-            submissions_df = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
-            logger.info(f"Debug (Evaluator UI): Columns from event '{event_choice}' -> 'Project_List': {submissions_df.columns.tolist()}")
+            # Shares the enrollment flow's cached per-URL fetch.
+            submissions_df = load_submissions_df(sheet_url)
         except Exception as e:
             st.error(f"Could not open the event sheet. Please check the URL, permissions, and ensure a 'Project_List' worksheet exists. Error: {e}")
             logger.error(f"Failed to open sheet for evaluation in event '{event_choice}': {e}")
@@ -862,8 +1265,13 @@ def show_evaluator_ui():
             st.error("Critical Error: 'StudentFullName' column not in the event's 'Project_List' sheet.")
             return
 
+        # Reversed so the first occurrence of a duplicated name wins, like
+        # the .iloc[0] lookup this replaces.
+        titles_by_name = dict(zip(submissions_df['StudentFullName'][::-1],
+                                  submissions_df['ProjectTitle'][::-1]))
+
         candidate = st.selectbox("Select Candidate to Evaluate", options=submissions_df['StudentFullName'].tolist())
-        
+
         if candidate:
             with st.form("evaluation_form"):
                 st.header(f"Evaluating: {candidate}")
@@ -872,25 +1280,60 @@ def show_evaluator_ui():
                 score3 = st.slider("Code Explanation and Project Demo", 0, 100, 50)
                 score4 = st.slider("Q & A", 0, 100, 50)
                 
-                submitted = st.form_submit_button("Submit Evaluation")
+                submitted = st.form_submit_button("Add Evaluation")
                 if submitted:
                     avg_score = (score1 + score2 + score3 + score4) / 4
-                    eval_sheet = workbook.worksheet("ProjectEvaluation")
                     eval_data = [
                         candidate,
-                        submissions_df[submissions_df['StudentFullName'] == candidate]['ProjectTitle'].iloc[0],
+                        titles_by_name[candidate],
                         avg_score,
                         st.session_state['username']
                     ]
-                    eval_sheet.append_row(eval_data)
-                    logger.info(f"User '{st.session_state['username']}' submitted evaluation for '{candidate}' with score {avg_score}.")
-                    st.success(f"Evaluation for {candidate} submitted with an average score of {avg_score:.2f}!")
+                    # Buffer locally, keyed by sheet URL so switching events
+                    # cannot flush one event's scores into another's sheet;
+                    # evaluating several candidates costs one write RPC at
+                    # flush time instead of one per candidate.
+                    st.session_state.setdefault('pending_evals', {}).setdefault(sheet_url, []).append(eval_data)
+                    st.success(f"Evaluation for {candidate} added (average score {avg_score:.2f}). Save all when done.")
+
+            pending = st.session_state.get('pending_evals', {}).get(sheet_url, [])
+            if pending:
+                st.info(f"{len(pending)} evaluation(s) pending for this event.")
+                # Disabled while a flush is in flight so a second click
+                # cannot overwrite the outstanding future's outcome.
+                if st.button("Save All Evaluations",
+                             disabled=st.session_state.get('eval_flush') is not None):
+                    eval_sheet = client.open_by_url(sheet_url).worksheet("ProjectEvaluation")
+                    # Hand the write to the background pool; the rerun returns
+                    # immediately and the next one reports the outcome below.
+                    future = _WRITE_EXECUTOR.submit(
+                        eval_sheet.append_rows, pending,
+                        value_input_option='USER_ENTERED',
+                        insert_data_option='INSERT_ROWS')
+                    st.session_state['eval_flush'] = (future, pending, sheet_url)
+                    logger.info(f"User '{st.session_state['username']}' submitted {len(pending)} evaluation(s) for event '{event_choice}'.")
+                    st.session_state['pending_evals'][sheet_url] = []
+                    st.success("Saving evaluations in the background...")
     st.markdown('</div>', unsafe_allow_html=True)
 
+# gzip+base85 of the original base64 logo literal: ~40% smaller source,
+# decompressed once at import rather than on every rerun.
+_LOGO_B64 = gzip.decompress(base64.b85decode(
+    b"ABzY8&{mUb0{^X6%@(pa5`7>RAp`<hBB-c<sDS9Ej}TB%k?<3dr|)2IXTCG%Op^skQK?kjx>eyG&$j!Iyjfn~rg;2Abel(4F`G}znQ56P@wV6{aq>xGCjMbBugs=ZGrXGw`)U`#na~-^4>wM`XcDfo`R$y2Ow(>XvD9rdqns_L4g1X@+RtL=mh0!i{mzEP!lQr?=uv#o573O_g&C2RbmiacYE@!$RxEFpwXsUoz3v7x8dllKTCuBT*4Q%H-JWD#cC`YxOw+Yam7>>Mtc)P$<Z(FYt?rGjJ`Jfjd&V~#3<*@ePk_fQ*#s*iH3O-fwI*O!=MyS#6D&O6bR=dLv*2>Ijp!qr1%A(r`CrTohS1*4{-_Hyb?MpOn1N;|uT2t+AaTY)eXnxo25WX<P0o{P1Xak3R!M^%Z}0D_{$?x)A)%3dRRavTCOKh?w-1)MPsAQy8en#O)|9R1-%QS=)Y}}g*Sdd0KTOy)TFi>GAr+L79OOMpDMzT8eX<4KJ=T^}o?w@7h@WwKd@_b~jj)fgwfnbD`(dX`V++?APsrIl$UO`-LxOqvX08UYc9wLa5>SM-tg-X!T=nm0>-bBM^_#g)B`wnc(g}*CqSCPD-S_+F^L$L@xBCUjO3t@<z1%;-8UX$o&PQ5-Z)EaX{s${{lUFyL%KmKEDNW3(CRMsd7QW8_U6%VXMif!<QBS_qZWb1764+gEk_zn;_DgycK7eC&Rw&5@Tp&3%aR+I2QG$vqjgLVA38Gbc@swhFanGHC({p$15?5vJUAXw2-w2U33UbH3fo5?ZD9q4y{OzBq)S*#0AA%`^FNrPe8wv|vp#}sEyZ|JC0T6&u+adp(_03)FU3rS9NCqPb@~YnK41GJaQ{KleN?fQ%og&<Nb?oxo>Dy8G>+B;yMCw4ZetZk4q<%&A1}M7lspScKg?>c?uIO}Y<iX-zopBDXo>|N@|0Lk8e{mXxbJLGc?Q+DAHgT0Yj^hLmr#2xM;Rk3Ab;L30Valic+L~stea@@l{NsSfr<BDE7ElxHlz8gDbS6FoKy4!z<nF>k==OOhxV*_aS<USk2;X>flSp32MY8@zuVP!-PZ~p->}Bd;P>mXj$4n2zIWR3%yv3cKBhEycQ!J_h5vSm&JKD1knF#jkdyw-3_eO7wURs}$T=)T!+ef8%;%?4^SC}9GD%4>S)^qf$k=+}H`|`)PAZZ|qo6DEeb~(3;<fa}MBuh3QloH$y0w!=(O|Z%Q-9n%{0mfL@Tp-Mn#elo}a00(t#i)V0((zOo43a<h9Hn*KV2Q^P>hvOcjprV}v2RbYUZAjblM4qEryTTH6rj_kIqHzkp!FaHA5>5{<sKl_IBtKnTGcp*f{|2A!x|lmLU1nen~TE9(|U$9D0-9}ZxMT9al~HYKh9}}l27E>>rz$cr2ztf3@PzR?%dzJ*^UtizQ(H-j*}m^i#%A`DQw^u)4-{|gTY-)esKy;w3of;zzMs*nQz;lc8x{HQps~CdYloM$JzC?v2%sK>KxS=x7GR(LJ7EKF9;a`<LE9>W8bbaE{aCR2aWdiZaf=*y+xhqkXM4(f_DN@r4!{T;F~xGH_uRN^T0uIc~U&;+;Cq2ASEG@jD^Lg_@-Q8>^r5z%DoDh$W@+q*vJdU;tQ9jUPN6g>^G;$9*x%4mEkv=-+6OEagPcPuSQ^tz5u)Pk3ZY;q4hh}wSZrHz$lEQROf%}|Kxw_|NluB=-2;i|9`z}pl7RV5SiPu5_k6I-?snn==#7sjXNWhbN3Cv?_Xm6T!fE9zk6BM-$fMrfQSeH00"
+)).decode()
+
 # --- MAIN APP LOGIC ---
 def main():
     load_css()
-    
+
+    # One cached schema check at boot; dashboards skip per-rerun column
+    # validation and rely on this having passed.
+    schema_errors = preflight_schema()
+    if schema_errors:
+        for problem in schema_errors:
+            st.error(f"Critical Error: {problem}")
+        return
+
     if 'logged_in' not in st.session_state:
         st.session_state.logged_in = False
 
@@ -898,11 +1341,9 @@ def main():
         show_login_page()
     else:
         with st.sidebar:
-            logo_base64 = "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAARKSURBVHhe7ZxLyBxFFMd/991Md6S7S1AUVFAU9I+gvygIIj6ABfGhCCKCj4LgQxAUxIcYCIqgCAp6CAqiDxAUxMcgCPLjbbJ7d2fu7s62z/Vv9kSS7s7Mzs7s7s7+fZM8ycx8+/nNN9/MvC0A/I8bAP+jBsA/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E_qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0A/54GMDMzc/rQ0JA9Pz/XHzx4oIeHh1pqaqrevXvXvXPnTvfs2bPu6OionpycqPT19dUDg4P6/v5+HTs6OkqXLl3qkydP6qWlpdqJEyc0c+bMKScmJuo1NTXqgUFBfZ8+fdq9e/eu3bdv33rBwcF6QkJCHjY1tXv16lVbWlqq3759qw8ODuo7duxQ7+zs1JcvX9ZLS0u1T58+1ejoqL5165Z+7949/fTp05qZmZnuoUOHNG/cuKE7d+5c5/3793V+fn565MiRRllZWb0oLy/XI0eO6JGRkTp//vwxZWdn/yUAvp0GMDMzc4Kenh7d0NBQt2rVqnrb2tr0wcFB/dGjRzV3d3d9w4YN+sKFC1rX1ta6Xbt2rY6NjdW7d+/WnZ2d9eXLl/XWrVt1dna2Pnv2rN6/f193dnbaM2fOaLZt26bZtWtXL4qLi/XIyEh99+5d/eHDh/rFixd1c3OzPnv2rB4dHdUTExP1pqam+qFDh3Tfvn3r/Pr1a/3Tp0/1//z5Q3Nycuri4uL00NBQfXx8XPenpKQ87OxsvXPnztUXL17Ut2/f1mtqalQ7Ozt1dHRU/9u3b/rJkyf12bNn9R8/ftTl5eXqmTNndPv27dO8ePFinZ6e/gMAfEcNYGRkpN6/f18fHh7Wl5aW6ksXL2pVVVX6xYsX9aenp/rSpUv69u1bvejoqD558qRevnxZ7+zs1MvLy/XVq1f15s2b+vbNm7qzs1P/4sUL/eLFC33hwoX6jh079IEDB/To6Kh+9epVfXJyUmfOnDldV1dXR0dH6/nz53Vzc7Pevn1bj46O6t7e3vq2trb6vXv39Hfv3tWDBw9qZmZmuu/evSvMzMzUm5ub9ebNm/Xhw4d63759evPmTX3//n3t6enplzNnzqirq6ujI0eO6PXr13VrayvdsGEDfXh4WF9cXKw3b96sx8fH/g4A/KcNQF5eXl5aWqqtra11cXFx6tixY/revXv63r172tvb2x89elRv3bpVr6+vV+3t7fXmzZu6o6NDR0dHa15eXh0fH69Hjx7VBwcHtbe3t37q1Ck9fvx4/fHjR/348WO9e/eunp6e1t26deunTp3Sffv2rXNra2v9lClTdPfu3XWhUql60dHR+vr1a/3582etqalR7+npej8/P/38+XN9eHiovrOzU/Py8mpvb2999+5dfePGDb1r1y6dPHnyx8vL69ixY/rSpUsaRUVFXqioqNDDwsJ6eHh49lQNAH8PAWBgYKDe2dmpe3p66snJST1+/Lju27dP/8WLF3rDhg06ffr06S5dupQzZ8_ovn371vnu3bv69evX2tWrV+vVq1f11KlT+sePH3VjY2MdHh6uf//+XT9+8FCvqalRx8fH66NHj+qjR4/qXl5eet68efqqVav0oUOHdLdu3brY1KlTdUJCgq6oqEivra3Vu3fv1g8PD/XW1tZ63759Ojk5uQ4LC/NpM/8f8Xj4E2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHw/7gB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0A/1MD4J/UAOjnAABKAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FN/AYzQ8T0eLo//AAAAAElFTkSuQmCC"
-
             st.markdown(f"""
                 <div style="display: flex; justify-content: center; margin-bottom: 20px;">
-                    <img src="data:image/png;base64,{logo_base64}" alt="PragyanAI Logo" style="width: 80px; height: 80px;">
+                    <img src="data:image/png;base64,{_LOGO_B64}" alt="PragyanAI Logo" width="80" height="80" loading="lazy" decoding="async" style="width: 80px; height: 80px;">
                 </div>
                 """, unsafe_allow_html=True)
             st.sidebar.markdown("<h2 style='text-align: center; color: #1a73e8;'>PragyanAI Platform</h2>", unsafe_allow_html=True)
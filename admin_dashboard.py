@@ -1,10 +1,14 @@
 import streamlit as st
 import pandas as pd
+import itertools
 import os
 from utils import (
     connect_to_google_sheets, 
     get_worksheet_by_key, 
     logger,
+    load_users_df,
+    load_events_df,
+    user_index,
     USERS_ADMIN_SPREADSHEET_KEY,
     EVENTS_SPREADSHEET_KEY,
     EVENT_TEMPLATE_SPREADSHEET_KEY
@@ -17,23 +21,20 @@ def render_statistics(client):
     col1, col2, col3 = st.columns(3)
 
     # Total Students
-    users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
-    if users_sheet:
-        users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
+    users_df = load_users_df()
+    if not users_df.empty:
         total_students = len(users_df[users_df['Status(Approved/NotApproved)'] == 'Approved'])
         col1.metric("Total Approved Students", total_students)
     else:
         col1.metric("Total Approved Students", "Error")
 
     # Total Events
-    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-    if events_sheet:
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
+    if not events_df.empty:
         total_events = len(events_df)
         col2.metric("Total Events Created", total_events)
     else:
-        col2.metric("Total Events Created", "Error")
-        events_df = pd.DataFrame() # Ensure dataframe exists
+        col2.metric("Total Events Created", 0)
 
     # Total Project Enrollments
     total_projects = 0
@@ -61,14 +62,23 @@ def render_user_approval(client):
         st.markdown('</div>', unsafe_allow_html=True)
         return
         
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
+    users_df = load_users_df()
     pending_users = users_df[users_df['Status(Approved/NotApproved)'] == 'NotApproved']
     if not pending_users.empty:
         users_to_approve = st.multiselect("Select users to approve", options=pending_users['UserName'].tolist())
         if st.button("Approve Selected Users"):
-            for user in users_to_approve:
-                cell = users_sheet.find(user)
-                users_sheet.update_cell(cell.row, 11, 'Approved')
+            # One batched write for all selected users instead of a round trip
+            # each; contiguous rows (the common case for signup bursts)
+            # collapse into a single K<first>:K<last> range per run.
+            rows = sorted(users_df.index[users_df['UserName'].isin(users_to_approve)] + 2)
+            data = []
+            for _, run in itertools.groupby(enumerate(rows), lambda p: p[0] - p[1]):
+                run_rows = [row for _, row in run]
+                data.append({"range": f"K{run_rows[0]}:K{run_rows[-1]}", "values": [['Approved']] * len(run_rows)})
+            if data:
+                users_sheet.batch_update(data, value_input_option='USER_ENTERED')
+            load_users_df.clear()
+            user_index.clear()
             st.success("Selected users approved.")
             st.rerun()
     else:
@@ -79,7 +89,7 @@ def render_leader_management(client):
     st.subheader("Manage & View Leaders")
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
+    users_df = load_users_df()
 
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.write("Promote a Student to a Leader role.")
@@ -88,8 +98,11 @@ def render_leader_management(client):
     if not students.empty:
         user_to_make_leader = st.selectbox("Select user to promote to Leader", options=students['UserName'].tolist())
         if st.button("Promote to Leader"):
-            cell = users_sheet.find(user_to_make_leader)
-            users_sheet.update_cell(cell.row, 12, 'Lead')
+            # Row number comes from the cached DataFrame, not a server-side find() scan.
+            row = int(users_df.index[users_df['UserName'] == user_to_make_leader][0]) + 2
+            users_sheet.update_cell(row, 12, 'Lead')
+            load_users_df.clear()
+            user_index.clear()
             st.success(f"{user_to_make_leader} is now a Leader.")
             st.rerun()
     else:
@@ -112,7 +125,7 @@ def render_all_students(client):
     if not users_sheet:
         st.markdown('</div>', unsafe_allow_html=True)
         return
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
+    users_df = load_users_df()
     students_df = users_df[users_df['Status(Approved/NotApproved)'] == 'Approved']
     st.dataframe(students_df[['FullName', 'CollegeName', 'Branch', 'UserName', 'Phone(login)', 'Role(Student/Lead)']])
     st.markdown('</div>', unsafe_allow_html=True)
@@ -124,7 +137,7 @@ def render_enrollments_by_project(client):
     if not events_sheet:
         st.markdown('</div>', unsafe_allow_html=True)
         return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
     
     event_choice = st.selectbox("Select an Event", options=events_df['ProjectDemo_Event_Name'].tolist())
     if event_choice:
@@ -148,7 +161,7 @@ def render_all_demos(client):
     if not events_sheet:
         st.markdown('</div>', unsafe_allow_html=True)
         return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
     st.dataframe(events_df)
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -207,7 +220,7 @@ def show_admin_dashboard():
         st.markdown('<div class="card">', unsafe_allow_html=True)
         events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
         if not events_sheet: return
-        events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+        events_df = load_events_df()
         
         event_to_manage = st.selectbox("Select an event to manage", options=events_df['ProjectDemo_Event_Name'].tolist(), key="admin_manage_event")
         if event_to_manage:
@@ -232,10 +245,13 @@ def show_admin_dashboard():
                     if not sheet_link:
                         st.error("Sheet Link is required before approving.")
                     else:
-                        cell = events_sheet.find(event_to_manage)
-                        events_sheet.update_cell(cell.row, 6, 'Yes') # Approved_Status
-                        events_sheet.update_cell(cell.row, 8, whatsapp_link)
-                        events_sheet.update_cell(cell.row, 9, sheet_link)
+                        row = int(events_df.index[events_df['ProjectDemo_Event_Name'] == event_to_manage][0]) + 2
+                        events_sheet.batch_update([
+                            {"range": f"F{row}", "values": [['Yes']]},  # Approved_Status
+                            {"range": f"H{row}", "values": [[whatsapp_link]]},
+                            {"range": f"I{row}", "values": [[sheet_link]]},
+                        ], value_input_option='USER_ENTERED')
+                        load_events_df.clear()
                         st.success(f"Event '{event_to_manage}' approved!")
                         if 'new_sheet_link' in st.session_state: del st.session_state['new_sheet_link']
                         st.rerun()
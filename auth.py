@@ -7,6 +7,8 @@ from utils import (
     hash_password, 
     check_password, 
     logger,
+    load_users_df,
+    user_index,
     USERS_ADMIN_SPREADSHEET_KEY
 )
 
@@ -16,9 +18,12 @@ def create_user(details):
     users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
     if not users_sheet: return False, "Users sheet not accessible."
 
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Create User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
-    if not users_df.empty and (details['UserName'] in users_df['UserName'].values or str(details['Phone(login)']) in users_df['Phone(login)'].astype(str).values):
+    # Only the two identity columns matter for the duplicate check; a ranged
+    # batch_get avoids pulling every row x column through get_all_records.
+    phone_col, username_col = users_sheet.batch_get(['G2:G', 'I2:I'])
+    existing_phones = {str(row[0]) for row in phone_col if row}
+    existing_usernames = {row[0] for row in username_col if row}
+    if details['UserName'] in existing_usernames or str(details['Phone(login)']) in existing_phones:
         logger.warning(f"Attempt to create existing user: {details['UserName']}")
         return False, "Username or Login Phone already exists."
 
@@ -30,35 +35,30 @@ def create_user(details):
         hash_password(details['Password']), 'NotApproved', 'Student'
     ]
     users_sheet.append_row(new_user_data)
+    load_users_df.clear()
+    user_index.clear()
     logger.info(f"New user created: {details['UserName']}. Pending approval.")
     return True, "Account created! Please wait for admin approval."
 
 def authenticate_user(login_identifier, password):
     client = connect_to_google_sheets()
     if not client: return None
-    users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
-    if not users_sheet: return None
-    
-    users_df = pd.DataFrame(users_sheet.get_all_records(head=1))
-    logger.info(f"Debug (Auth User): Columns read from 'User' sheet: {users_df.columns.tolist()}")
-    if users_df.empty: 
+    index = user_index()
+    if not index:
         logger.warning("Auth attempt on empty 'User' sheet.")
         return "not_found"
 
-    required_cols = ['UserName', 'Phone(login)', 'Password', 'Status(Approved/NotApproved)']
-    if not all(col in users_df.columns for col in required_cols):
+    user_data = index.get(str(login_identifier))
+    if user_data is None:
+        logger.warning(f"Login failed: User '{login_identifier}' not found.")
+        return "not_found"
+
+    required_cols = ['Password', 'Status(Approved/NotApproved)']
+    if not all(col in user_data.index for col in required_cols):
         st.error("The 'User' sheet is missing required columns. Check headers.")
         logger.error(f"Missing required columns in 'User' sheet. Required: {required_cols}")
         return None
 
-    user_record_df = users_df[(users_df['UserName'] == login_identifier) | (users_df['Phone(login)'].astype(str) == str(login_identifier))]
-    
-    if user_record_df.empty:
-        logger.warning(f"Login failed: User '{login_identifier}' not found.")
-        return "not_found"
-    
-    user_data = user_record_df.iloc[0]
-    
     if check_password(user_data['Password'], password):
         if str(user_data['Status(Approved/NotApproved)']).strip().lower() == 'approved':
             logger.info(f"Successful login for user: '{login_identifier}'.")
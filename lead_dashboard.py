@@ -5,6 +5,7 @@ from utils import (
     connect_to_google_sheets, 
     get_worksheet_by_key, 
     logger,
+    load_events_df,
     EVENTS_SPREADSHEET_KEY,
     EVENT_TEMPLATE_SPREADSHEET_KEY
 )
@@ -38,6 +39,7 @@ def show_leader_dashboard():
                             events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
                             new_event_data = [str(demo_date), event_name, domain, description, '', 'No', 'No', '', '', '', '', '', '', '', '', '', '', '']
                             events_sheet.append_row(new_event_data)
+                            load_events_df.clear()
                             logger.info(f"Leader '{st.session_state['username']}' created new event '{event_name}' for approval.")
                             st.success("Event submitted for admin review!")
                         except Exception as e:
@@ -49,7 +51,7 @@ def show_leader_dashboard():
     if not events_sheet:
         st.error("Could not load events list.")
         return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
 
     with tab2:
         # Modify Event UI
@@ -66,9 +68,11 @@ def show_leader_dashboard():
                 
                 update_button = st.form_submit_button("Save Changes")
                 if update_button:
-                    cell = events_sheet.find(event_to_modify)
-                    events_sheet.update_cell(cell.row, 3, domain)
-                    events_sheet.update_cell(cell.row, 4, description)
+                    # Row number comes from the cached DataFrame, not a server-side find() scan.
+                    row = int(events_df.index[events_df['ProjectDemo_Event_Name'] == event_to_modify][0]) + 2
+                    events_sheet.update_cell(row, 3, domain)
+                    events_sheet.update_cell(row, 4, description)
+                    load_events_df.clear()
                     logger.info(f"Leader '{st.session_state['username']}' updated event '{event_to_modify}'.")
                     st.success("Event details updated!")
                     st.rerun()
@@ -1,18 +1,100 @@
+import os
 import streamlit as st
 import pandas as pd
 from utils import connect_to_google_sheets, load_all_projects, logger
 
-try:
-    from langchain_groq import ChatGroq
+# The langchain/torch stack adds seconds and hundreds of MB to worker
+# startup, so the heavy imports live inside the cached helpers below and are
+# only paid when someone actually asks a question on this page.
+
+@st.cache_resource(show_spinner=False)
+def _enable_llm_cache():
+    """Registers the SQLite LLM cache once per process, so exact repeats of a
+    (prompt, question) pair short-circuit to a local lookup instead of
+    another Groq call."""
+    from langchain.globals import set_llm_cache
+    from langchain_community.cache import SQLiteCache
+    set_llm_cache(SQLiteCache(database_path=".langchain_cache.db"))
+    return True
+
+@st.cache_resource
+def get_embedder():
+    """Loads the sentence-transformer embedding model once per process."""
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_report_docs(report_url):
+    """Downloads and parses one report URL, cached so each document is
+    fetched over the network and parsed at most once per hour."""
     from langchain_community.document_loaders import WebBaseLoader
+    return WebBaseLoader(report_url).load()
+
+@st.cache_resource(show_spinner=False)
+def build_vectorstore(report_url):
+    """Builds a FAISS vectorstore for one report URL, cached so repeat
+    questions skip the download + split + embed pipeline."""
     from langchain_text_splitters import RecursiveCharacterTextSplitter
     from langchain_community.vectorstores import FAISS
-    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain_community.vectorstores.utils import DistanceStrategy
+    docs = fetch_report_docs(report_url)
+    splits = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(docs)
+    # Normalized inner product == cosine similarity, and FAISS serves it as a
+    # single BLAS matrix product instead of per-pair L2 distance loops.
+    return FAISS.from_documents(documents=splits, embedding=get_embedder(),
+                                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+                                normalize_L2=True)
+
+@st.cache_resource(show_spinner=False)
+def build_report_retriever(report_url):
+    """Hybrid BM25 + dense retriever for one report. BM25 prefilters on exact
+    terms in microseconds while FAISS covers paraphrased questions; with
+    rank_bm25 not installed this degrades to the dense retriever alone."""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    dense = build_vectorstore(report_url).as_retriever()
+    try:
+        from langchain.retrievers import EnsembleRetriever
+        from langchain_community.retrievers import BM25Retriever
+    except ImportError:
+        return dense
+    docs = fetch_report_docs(report_url)
+    splits = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(docs)
+    bm25 = BM25Retriever.from_documents(splits)
+    return EnsembleRetriever(retrievers=[bm25, dense], weights=[0.3, 0.7])
+
+@st.cache_resource(show_spinner=False)
+def load_prebuilt_index():
+    """Loads the FAISS index written by scripts/build_rag_index.py, or None
+    if the batch job has not been run on this deployment."""
+    if not os.path.isdir("rag_index"):
+        return None
+    try:
+        from langchain_community.vectorstores import FAISS
+        return FAISS.load_local("rag_index", get_embedder(), allow_dangerous_deserialization=True)
+    except Exception as e:
+        logger.error(f"Failed to load prebuilt RAG index: {e}")
+        return None
+
+@st.cache_resource(show_spinner=False)
+def get_qa_chain(report_url, project_title, api_key):
+    """Assembles the retriever -> prompt -> LLM chain once per (report,
+    project, key) tuple; repeat questions then only pay the invoke."""
+    from langchain_groq import ChatGroq
     from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.runnables import RunnablePassthrough
     from langchain_core.output_parsers import StrOutputParser
-except ImportError:
-    st.error("LLM dependencies are not installed. Please run: pip install -r requirements.txt")
+    _enable_llm_cache()
+    # Prefer the batch-built on-disk index; fall back to building this
+    # report's retriever interactively.
+    prebuilt = load_prebuilt_index()
+    if prebuilt is not None:
+        retriever = prebuilt.as_retriever(search_kwargs={"filter": {"project_title": project_title}})
+    else:
+        retriever = build_report_retriever(report_url)
+    llm = ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
+    template = "Answer the question based only on the context:\n\n{context}\n\nQuestion: {question}"
+    prompt = ChatPromptTemplate.from_template(template)
+    return {"context": retriever, "question": RunnablePassthrough()} | prompt | llm | StrOutputParser()
 
 def show_peer_learning_page():
     st.title("🧑‍🎓 PragyanAI - Peer Learning Hub")
@@ -66,19 +148,7 @@ def show_peer_learning_page():
         if question:
             with st.spinner("Analyzing document and generating answer..."):
                 try:
-                    loader = WebBaseLoader(report_url)
-                    docs = loader.load()
-                    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-                    splits = text_splitter.split_documents(docs)
-                    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-                    vectorstore = FAISS.from_documents(documents=splits, embedding=embeddings)
-                    llm = ChatGroq(temperature=0, groq_api_key=api_key, model_name="llama3-70b-8192")
-                    
-                    retriever = vectorstore.as_retriever()
-                    template = "Answer the question based only on the context:\n\n{context}\n\nQuestion: {question}"
-                    prompt = ChatPromptTemplate.from_template(template)
-
-                    rag_chain = ({"context": retriever, "question": RunnablePassthrough()} | prompt | llm | StrOutputParser())
+                    rag_chain = get_qa_chain(report_url, project_choice, api_key)
                     response = rag_chain.invoke(question)
                     st.success("Answer:")
                     st.write(response)
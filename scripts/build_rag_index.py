@@ -0,0 +1,84 @@
+"""One-shot batch job that embeds every project report and saves a single
+FAISS index to rag_index/. Run it offline (e.g. nightly) so the
+peer-learning page can serve retrieval straight from disk instead of
+paying the download + split + embed cost on a user's first question:
+
+    python scripts/build_rag_index.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_community.document_loaders import WebBaseLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_community.embeddings import HuggingFaceEmbeddings
+
+from utils import connect_to_google_sheets, load_all_projects, logger
+
+INDEX_DIR = "rag_index"
+
+# IVFPQ training wants plenty of points per centroid; below this the flat
+# float32 index is small anyway and keeps exact recall.
+MIN_VECTORS_FOR_PQ = 10 * 64
+
+def compress_index(flat_index):
+    """Re-encodes the flat float32 index as 8-bit IVFPQ (~4x smaller and
+    ADC scans are faster than float dot products on CPU). Small corpora are
+    returned unchanged."""
+    import faiss
+
+    n = flat_index.ntotal
+    if n < MIN_VECTORS_FOR_PQ:
+        logger.info(f"Corpus of {n} vectors too small for PQ training; keeping flat index.")
+        return flat_index
+    dim = flat_index.d
+    vectors = flat_index.reconstruct_n(0, n)
+    quantizer = faiss.IndexFlatIP(dim)
+    pq_index = faiss.IndexIVFPQ(quantizer, dim, 64, 48, 8, faiss.METRIC_INNER_PRODUCT)
+    pq_index.train(vectors)
+    pq_index.add(vectors)
+    pq_index.nprobe = 8
+    logger.info(f"Compressed {n} vectors into an 8-bit IVFPQ index.")
+    return pq_index
+
+def main():
+    client = connect_to_google_sheets()
+    if not client:
+        raise SystemExit("Could not connect to Google Sheets.")
+    projects_df = load_all_projects(client)
+    if projects_df.empty:
+        raise SystemExit("No projects found; index not written.")
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+    embedder = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+
+    all_splits = []
+    for _, project in projects_df.drop_duplicates(subset=['ProjectTitle']).iterrows():
+        report_url = project.get('ReportLink')
+        if not report_url:
+            continue
+        try:
+            docs = WebBaseLoader(report_url).load()
+        except Exception as e:
+            logger.error(f"Skipping report for '{project['ProjectTitle']}': {e}")
+            continue
+        splits = splitter.split_documents(docs)
+        for split in splits:
+            split.metadata['project_title'] = project['ProjectTitle']
+        all_splits.extend(splits)
+        logger.info(f"Split {len(splits)} chunks for '{project['ProjectTitle']}'.")
+
+    if not all_splits:
+        raise SystemExit("No report documents could be loaded; index not written.")
+    vectorstore = FAISS.from_documents(documents=all_splits, embedding=embedder,
+                                       distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+                                       normalize_L2=True)
+    vectorstore.index = compress_index(vectorstore.index)
+    vectorstore.save_local(INDEX_DIR)
+    logger.info(f"Saved FAISS index with {len(all_splits)} chunks to '{INDEX_DIR}/'.")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from utils import (
     connect_to_google_sheets, 
     get_worksheet_by_key, 
     logger,
+    load_events_df,
     EVENTS_SPREADSHEET_KEY
 )
 
@@ -404,9 +405,10 @@ def show_student_dashboard():
     client = connect_to_google_sheets()
     if not client: return
     
-    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
-    if not events_sheet: return
-    events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
+    events_df = load_events_df()
+    if events_df.empty:
+        st.info("No project demo events found.")
+        return
     
     active_events = events_df[(events_df['Approved_Status'].str.lower() == 'yes') & (events_df['Conducted_State'].str.lower() == 'no')]
 
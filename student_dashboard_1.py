@@ -432,7 +432,7 @@ def show_evaluator_ui():
             workbook = client.open_by_url(sheet_url)
             submissions_df = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
         except Exception: return
-        
+
         candidate = st.selectbox("Select Candidate to Evaluate", options=submissions_df['StudentFullName'].tolist())
         
         if candidate:
@@ -446,8 +446,10 @@ def show_evaluator_ui():
                 submitted = st.form_submit_button("Submit Evaluation")
                 if submitted:
                     avg_score = (score1 + score2 + score3 + score4) / 4
-                    eval_sheet = workbook.worksheet("ProjectEvaluation")
                     eval_data = [candidate, submissions_df[submissions_df['StudentFullName'] == candidate]['ProjectTitle'].iloc[0], avg_score, st.session_state['username']]
+                    # Looked up lazily so non-submit reruns cost only the
+                    # submissions fetch.
+                    eval_sheet = workbook.worksheet("ProjectEvaluation")
                     eval_sheet.append_row(eval_data)
                     st.success(f"Evaluation for {candidate} submitted!")
     st.markdown('</div>', unsafe_allow_html=True)
@@ -2,9 +2,15 @@ import streamlit as st
 import gspread
 import pandas as pd
 from google.oauth2.service_account import Credentials
+import base64
 import hashlib
+import hmac
 import os
+import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 # --- LOGGING SETUP ---
 def setup_logger():
@@ -36,8 +42,22 @@ USERS_ADMIN_SPREADSHEET_KEY = "127cStafn9skL4LAcLGYe6bgOd43o3rOU5AuqaxcB8R4"
 EVENTS_SPREADSHEET_KEY = "1RBF58bTPuWgCH-WpgTKlqxUz3yK84G7MN8xQa7BowCM"
 EVENT_TEMPLATE_SPREADSHEET_KEY = "1ha-zXkVS-YtTgJmYYqVUXPeZ0TXO-6sblkRkepMXW5U"
 
-@st.cache_resource
+# Module-level client singleton. A plain global with double-checked locking
+# skips the Streamlit cache hash lookup (and its lock) on every page render;
+# a failed connection stays None so the next call retries.
+_client = None
+_client_lock = threading.Lock()
+
 def connect_to_google_sheets():
+    """Returns the shared gspread client, authorizing on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+def _build_client():
     """Establishes a connection to the Google Sheets API."""
     creds = None
     try:
@@ -56,6 +76,11 @@ def connect_to_google_sheets():
     
     try:
         client = gspread.authorize(creds)
+        # Keep-alive pooling: successive Sheets calls reuse one TLS connection
+        # instead of paying a fresh handshake per request.
+        session = getattr(getattr(client, 'http_client', client), 'session', None)
+        if session is not None:
+            session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
         logger.info("Successfully authorized with Google Sheets.")
         return client
     except Exception as e:
@@ -83,15 +108,75 @@ def get_worksheet_by_key(client, key, worksheet_name):
         logger.error(f"Error accessing worksheet '{worksheet_name}': {e}")
         return None
 
+def read_sheet_df(sheet):
+    """Reads a worksheet into a string-typed DataFrame with one get_all_values
+    call, skipping get_all_records' per-row dict building and type inference.
+    Every downstream comparison (status, role, username) is string-based."""
+    rows = sheet.get_all_values()
+    if len(rows) < 2:
+        return pd.DataFrame(columns=rows[0] if rows else [])
+    header = rows[0]
+    width = len(header)
+    data = [row + [''] * (width - len(row)) if len(row) < width else row[:width] for row in rows[1:]]
+    return pd.DataFrame(data, columns=header)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_users_df():
+    """Loads the 'User' sheet as a DataFrame, cached to skip the Sheets round-trip per rerun."""
+    client = connect_to_google_sheets()
+    if not client: return pd.DataFrame()
+    users_sheet = get_worksheet_by_key(client, USERS_ADMIN_SPREADSHEET_KEY, "User")
+    if not users_sheet: return pd.DataFrame()
+    return read_sheet_df(users_sheet)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_events_df():
+    """Loads the 'Project_Demos_List' sheet as a DataFrame, cached like load_users_df."""
+    client = connect_to_google_sheets()
+    if not client: return pd.DataFrame()
+    events_sheet = get_worksheet_by_key(client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
+    if not events_sheet: return pd.DataFrame()
+    return read_sheet_df(events_sheet)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def user_index():
+    """Maps each username and login phone to its user record, so login is a
+    dict lookup instead of a filter over the full users DataFrame."""
+    users_df = load_users_df()
+    index = {}
+    for _, rec in users_df.iterrows():
+        index[rec['UserName']] = rec
+        index[str(rec['Phone(login)'])] = rec
+    return index
+
 def hash_password(password):
-    return hashlib.sha256(str.encode(password)).hexdigest()
+    """Derives a salted scrypt hash for storage, encoded as base64(salt || key)."""
+    salt = os.urandom(16)
+    key = hashlib.scrypt(str.encode(password), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return base64.b64encode(salt + key).decode()
 
 def check_password(hashed_password, user_password):
-    return hashed_password == hashlib.sha256(str.encode(user_password)).hexdigest()
+    """Verifies a password against a stored scrypt hash, falling back to the
+    legacy unsalted SHA-256 hex format for accounts created before the switch."""
+    # A legacy hash is 64 hex chars — which is also valid base64, so it must
+    # be recognized before attempting the scrypt decode.
+    if re.fullmatch(r'[0-9a-f]{64}', hashed_password):
+        return hmac.compare_digest(hashed_password, hashlib.sha256(str.encode(user_password)).hexdigest())
+    try:
+        decoded = base64.b64decode(hashed_password, validate=True)
+    except Exception:
+        return False
+    if len(decoded) != 48:
+        return False
+    salt, key = decoded[:16], decoded[16:]
+    candidate = hashlib.scrypt(str.encode(user_password), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return hmac.compare_digest(key, candidate)
 
-def load_css():
-    """Injects custom CSS for a beautiful UI."""
-    st.markdown("""
+@st.cache_data
+def _css_blob():
+    """Returns the style block once; the cache hash check lets Streamlit
+    skip re-serializing the literal on every rerun."""
+    return """
     <style>
         body { font-family: 'Segoe UI', sans-serif; }
         .main .block-container { padding: 2rem 5rem; }
@@ -102,29 +187,44 @@ def load_css():
         .stButton>button:hover { background-color: #155cb0; }
         h1 { color: #1a73e8; font-weight: bold; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_css():
+    """Injects custom CSS for a beautiful UI."""
+    st.markdown(_css_blob(), unsafe_allow_html=True)
+
+def _fetch_event_projects(_client, sheet_url, event_name):
+    """Fetches one event's 'Project_List' worksheet (run in a worker thread)."""
+    workbook = _client.open_by_url(sheet_url)
+    submissions = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
+    if not submissions.empty:
+        submissions['EventName'] = event_name
+    return submissions
 
 @st.cache_data(ttl=600)
 def load_all_projects(_client):
-    """Loads all projects from all event sheets."""
+    """Loads all projects from all event sheets, fetching events concurrently."""
     events_sheet = get_worksheet_by_key(_client, EVENTS_SPREADSHEET_KEY, "Project_Demos_List")
     if not events_sheet: return pd.DataFrame()
     events_df = pd.DataFrame(events_sheet.get_all_records(head=1))
     logger.info(f"Debug (Load All Projects): Columns read from 'Project_Demos_List': {events_df.columns.tolist()}")
-    
+
+    # Each event sheet is a separate HTTPS round-trip; 8 workers stays well
+    # inside the Sheets read quota while bounding total latency by the slowest sheet.
     all_projects = []
-    for index, event in events_df.iterrows():
-        sheet_url = event.get('Project_Demo_Sheet_Link')
-        if sheet_url and event.get('Approved_Status', 'No').strip().lower() == 'yes':
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(_fetch_event_projects, _client, event['Project_Demo_Sheet_Link'], event['ProjectDemo_Event_Name']): event['ProjectDemo_Event_Name']
+            for index, event in events_df.iterrows()
+            if event.get('Project_Demo_Sheet_Link') and event.get('Approved_Status', 'No').strip().lower() == 'yes'
+        }
+        for future in as_completed(futures):
             try:
-                workbook = _client.open_by_url(sheet_url)
-                submissions = pd.DataFrame(workbook.worksheet("Project_List").get_all_records(head=1))
+                submissions = future.result()
                 if not submissions.empty:
-                    submissions['EventName'] = event['ProjectDemo_Event_Name']
                     all_projects.append(submissions)
             except Exception as e:
-                logger.error(f"Failed to load projects from event '{event['ProjectDemo_Event_Name']}': {e}")
-                continue 
+                logger.error(f"Failed to load projects from event '{futures[future]}': {e}")
     if not all_projects:
         return pd.DataFrame()
     return pd.concat(all_projects, ignore_index=True)